@@ -111,13 +111,14 @@ class ShortAdmin(admin.ModelAdmin):
                 messages.error(request, "Gemini video analysis service is not available. Please check API configuration.")
                 return HttpResponseRedirect(reverse('admin:api_short_changelist'))
             
-            if short.video_analysis_status == 'processing':
+            # Claim the short with a single conditional UPDATE so two admins can't both start it
+            claimed = Short.objects.filter(pk=short.pk).exclude(
+                video_analysis_status='processing'
+            ).update(video_analysis_status='processing')
+            if not claimed:
                 messages.warning(request, "Video analysis is already in progress for this short.")
                 return HttpResponseRedirect(reverse('admin:api_short_changelist'))
-            
-            # Set status to processing
             short.video_analysis_status = 'processing'
-            short.save(update_fields=['video_analysis_status'])
             
             try:
                 # Analyze the video
@@ -465,6 +466,7 @@ class ShortAdmin(admin.ModelAdmin):
         """Admin action to analyze videos for selected shorts using Gemini AI"""
         try:
             from .gemini_video_service import gemini_video_service
+            from .views import _release_video_analysis_claims
             
             if not gemini_video_service.is_available():
                 self.message_user(
@@ -478,9 +480,9 @@ class ShortAdmin(admin.ModelAdmin):
             successful_analyses = 0
             
             # Limit to 5 videos at once to avoid overwhelming the API
-            videos_to_process = queryset.filter(
+            videos_to_process = list(queryset.filter(
                 video_analysis_status__in=['pending', 'failed']
-            )[:5]
+            )[:5])
             
             if not videos_to_process:
                 self.message_user(
@@ -490,52 +492,57 @@ class ShortAdmin(admin.ModelAdmin):
                 )
                 return
 
-            for short in videos_to_process:
-                try:
-                    # Set status to processing
-                    short.video_analysis_status = 'processing'
-                    short.save(update_fields=['video_analysis_status'])
-                    
-                    # Analyze the video
-                    video_path = short.video.path
-                    analysis_result = gemini_video_service.analyze_video(video_path)
+            # Mark the whole batch processing with one UPDATE
+            Short.objects.filter(
+                pk__in=[short.pk for short in videos_to_process]
+            ).update(video_analysis_status='processing')
+
+            # gemini_rate_limiter paces the API calls; shorts still processing when the
+            # loop exits (an aborted request, a failed error save) go back to failed
+            try:
+                for short in videos_to_process:
+                    try:
+                        # Analyze the video
+                        video_path = short.video.path
+                        analysis_result = gemini_video_service.analyze_video(video_path)
                     
-                    if analysis_result.get('success', False):
-                        # Update the short with analysis data
-                        short.video_quality_score = analysis_result.get('quality_score', 0)
-                        short.video_analysis_summary = analysis_result.get('summary', '')
-                        short.video_content_categories = analysis_result.get('content_categories', [])
-                        short.video_engagement_prediction = analysis_result.get('engagement_prediction', 0)
-                        short.video_sentiment_score = analysis_result.get('sentiment_score', 0)
-                        short.video_analysis_status = 'completed'
-                        short.video_analysis_processed_at = timezone.now()
-                        short.video_analysis_error = None
+                        if analysis_result.get('success', False):
+                            # Update the short with analysis data
+                            short.video_quality_score = analysis_result.get('quality_score', 0)
+                            short.video_analysis_summary = analysis_result.get('summary', '')
+                            short.video_content_categories = analysis_result.get('content_categories', [])
+                            short.video_engagement_prediction = analysis_result.get('engagement_prediction', 0)
+                            short.video_sentiment_score = analysis_result.get('sentiment_score', 0)
+                            short.video_analysis_status = 'completed'
+                            short.video_analysis_processed_at = timezone.now()
+                            short.video_analysis_error = None
                         
-                        short.save(update_fields=[
-                            'video_quality_score', 'video_analysis_summary', 'video_content_categories',
-                            'video_engagement_prediction', 'video_sentiment_score', 'video_analysis_status',
-                            'video_analysis_processed_at', 'video_analysis_error'
-                        ])
+                            short.save(update_fields=[
+                                'video_quality_score', 'video_analysis_summary', 'video_content_categories',
+                                'video_engagement_prediction', 'video_sentiment_score', 'video_analysis_status',
+                                'video_analysis_processed_at', 'video_analysis_error'
+                            ])
                         
-                        successful_analyses += 1
-                    else:
-                        # Analysis failed
-                        error_msg = analysis_result.get('error', 'Unknown analysis error')
-                        short.video_analysis_status = 'failed'
-                        short.video_analysis_error = error_msg
-                        short.save(update_fields=['video_analysis_status', 'video_analysis_error'])
+                            successful_analyses += 1
+                        else:
+                            # Analysis failed
+                            error_msg = analysis_result.get('error', 'Unknown analysis error')
+                            short.video_analysis_status = 'failed'
+                            short.video_analysis_error = error_msg
+                            short.save(update_fields=['video_analysis_status', 'video_analysis_error'])
                     
-                    total_shorts += 1
+                        total_shorts += 1
                     
-                    # Add delay between requests to respect rate limits
-                    import time
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    short.video_analysis_status = 'failed'
-                    short.video_analysis_error = str(e)
-                    short.save(update_fields=['video_analysis_status', 'video_analysis_error'])
-                    total_shorts += 1
+                    except Exception as e:
+                        short.video_analysis_status = 'failed'
+                        short.video_analysis_error = str(e)
+                        short.save(update_fields=['video_analysis_status', 'video_analysis_error'])
+                        total_shorts += 1
+            finally:
+                _release_video_analysis_claims(
+                    [short.pk for short in videos_to_process],
+                    'Video analysis was interrupted before this short was processed',
+                )
 
             self.message_user(
                 request,
@@ -1,6 +1,10 @@
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from typing import Optional, Dict, Any, List
 from datetime import datetime
+from django.conf import settings
 from django.db import transaction
 from django.utils import timezone
 from .models import Comment, Short
@@ -10,12 +14,59 @@ import torch
 logger = logging.getLogger(__name__)
 
 
+class SentimentResultCache:
+    """
+    Thread-safe LRU of sentiment results keyed on normalized comment text.
+
+    Viral shorts attract many identical comments ("first!", "LOL", emoji runs),
+    so repeated texts skip the model entirely.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(comment_text: str, model_name: str = '') -> bytes:
+        normalized = ' '.join(comment_text.split()).lower()
+        return hashlib.sha256(f'{model_name}\0{normalized}'.encode('utf-8')).digest()
+
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+            return result
+
+    def set(self, key: bytes, result: Dict[str, Any]):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+
+
+# Shared across service instances; set COMMENT_SENTIMENT_CACHE_SIZE=0 to disable
+COMMENT_SENTIMENT_CACHE = SentimentResultCache(settings.COMMENT_SENTIMENT_CACHE_SIZE)
+
+
 class CommentAnalysisService:
     """
     Service for analyzing comment sentiment using Hugging Face transformers.
     Uses cardiffnlp/twitter-roberta-base-sentiment model.
     """
 
+    # Loaded pipelines by model name; creating a service per request or signal
+    # would otherwise reload the transformer every time
+    _pipelines = {}
+
     def __init__(self, model_name: str = "cardiffnlp/twitter-roberta-base-sentiment"):
         self.model_name = model_name
         self.pipeline = None
@@ -31,6 +82,12 @@ class CommentAnalysisService:
     def _load_pipeline(self):
         """Load the sentiment analysis pipeline if not already loaded"""
         if self.pipeline is None:
+            # Reuse a model another instance already loaded in this process
+            shared_pipeline = CommentAnalysisService._pipelines.get(self.model_name)
+            if shared_pipeline is not None:
+                self.pipeline = shared_pipeline
+                return
+
             try:
                 logger.info(f"Loading sentiment analysis pipeline: {self.model_name}")
                 
@@ -121,6 +178,7 @@ class CommentAnalysisService:
                         raise Exception(f"Pipeline loaded but failed test: {test_error}")
                 
                 logger.info("Sentiment analysis pipeline loaded and tested successfully")
+                CommentAnalysisService._pipelines[self.model_name] = self.pipeline
                 
             except Exception as e:
                 logger.error(f"Failed to load sentiment analysis pipeline: {str(e)}")
@@ -153,6 +211,11 @@ class CommentAnalysisService:
                 'error': 'Empty comment text'
             }
 
+        cache_key = SentimentResultCache.key(comment_text, self.model_name)
+        cached_result = COMMENT_SENTIMENT_CACHE.get(cache_key)
+        if cached_result is not None:
+            return dict(cached_result)
+
         try:
             if self.pipeline is None:
                 if not self.is_available:
@@ -169,6 +232,7 @@ class CommentAnalysisService:
                 model_device = next(self.pipeline.model.parameters()).device
                 if str(model_device) == 'meta':
                     logger.warning("Meta device detected, reinitializing pipeline")
+                    CommentAnalysisService._pipelines.pop(self.model_name, None)
                     self.pipeline = None
                     self._load_pipeline()
 
@@ -194,7 +258,7 @@ class CommentAnalysisService:
             sentiment_score = self._calculate_sentiment_score(p_pos, p_neu, p_neg)
             sentiment_label = self._get_sentiment_label(sentiment_score)
 
-            return {
+            analysis_result = {
                 'sentiment_score': sentiment_score,
                 'sentiment_label': sentiment_label,
                 'raw_scores': {
@@ -204,6 +268,8 @@ class CommentAnalysisService:
                 },
                 'error': None
             }
+            COMMENT_SENTIMENT_CACHE.set(cache_key, analysis_result)
+            return dict(analysis_result)
 
         except Exception as e:
             logger.error(f"Error analyzing comment: {str(e)}")
@@ -320,7 +386,6 @@ class CommentAnalysisService:
         # Update the comment with analysis results
         comment.sentiment_score = analysis_result['sentiment_score']
         comment.sentiment_label = analysis_result['sentiment_label']
-        from django.utils import timezone
         comment.analyzed_at = timezone.now()
         comment.save(update_fields=['sentiment_score', 'sentiment_label', 'analyzed_at'])
 
@@ -328,12 +393,46 @@ class CommentAnalysisService:
 
         return analysis_result
 
+    def analyze_many(self, comments: List[Comment]) -> Dict[int, Dict[str, Any]]:
+        """
+        Analyze several Comment instances and persist them with one bulk_update.
+
+        Args:
+            comments: Comment instances to analyze
+
+        Returns:
+            Mapping of comment id to its analysis results dictionary
+        """
+        results = {}
+        analyzed = []
+        analyzed_at = timezone.now()
+
+        for comment in comments:
+            analysis_result = self.analyze_comment(comment.content)
+            results[comment.id] = analysis_result
+
+            if analysis_result['error']:
+                logger.error(f"Failed to analyze comment {comment.id}: {analysis_result['error']}")
+                continue
+
+            comment.sentiment_score = analysis_result['sentiment_score']
+            comment.sentiment_label = analysis_result['sentiment_label']
+            comment.analyzed_at = analyzed_at
+            analyzed.append(comment)
+
+        if analyzed:
+            Comment.objects.bulk_update(analyzed, ['sentiment_score', 'sentiment_label', 'analyzed_at'])
+            logger.info(f"Bulk analyzed {len(analyzed)} comments")
+
+        return results
+
     def analyze_comments_for_short(self, short: Short, update_aggregate: bool = True) -> Dict[str, Any]:
         """
         Analyze all comments for a given Short and optionally update aggregate score.
 
         Args:
-            short: Short instance to analyze comments for
+            short: Short instance to analyze comments for; may carry a prefetched
+                pending_comments list of its unanalyzed active comments
             update_aggregate: Whether to update the Short's comment_analysis_score
 
         Returns:
@@ -341,7 +440,10 @@ class CommentAnalysisService:
         """
         logger.info(f"Analyzing all comments for short {short.id}")
 
-        comments = short.comments.filter(is_active=True).exclude(sentiment_score__isnull=False)
+        # Batch callers prefetch the unanalyzed comments onto short.pending_comments
+        comments = getattr(short, 'pending_comments', None)
+        if comments is None:
+            comments = short.comments.filter(is_active=True).exclude(sentiment_score__isnull=False)
         analyzed_count = 0
         total_score = 0
         error_count = 0
@@ -12,11 +12,14 @@ import time
 import base64
 import re
 import subprocess
+import wave
 from pathlib import Path
 from typing import Dict, Any, Optional
 from django.conf import settings
 from django.utils import timezone
 
+from .rate_limiter import gemini_rate_limiter
+
 try:
     import google.generativeai as genai
     GEMINI_AVAILABLE = True
@@ -43,6 +46,7 @@ class GeminiAudioAnalysisService:
         self.model_name = "gemini-2.5-flash"  # Best model for audio analysis
         self.client = None
         self.max_file_size_mb = 20  # 20MB limit for inline audio data
+        self.max_output_tokens = 2048
         
         if GEMINI_AVAILABLE and self.api_key:
             try:
@@ -198,13 +202,14 @@ SUMMARY: [brief summary of audio content]
                 text_part = {"text": self._prepare_audio_analysis_prompt()}
                 
                 # Generate content with timeout
+                gemini_rate_limiter.acquire(self._estimate_tokens(len(audio_bytes)))
                 response = self.client.generate_content(
                     [audio_part, text_part],
                     generation_config={
                         'temperature': 0.3,
                         'top_p': 0.8,
                         'top_k': 40,
-                        'max_output_tokens': 2048,
+                        'max_output_tokens': self.max_output_tokens,
                     }
                 )
                 
@@ -239,6 +244,10 @@ SUMMARY: [brief summary of audio content]
         # Should not reach here, but just in case
         return self._get_default_audio_analysis(audio_path, "Unexpected error in retry loop")
     
+    def _estimate_tokens(self, audio_size_bytes: int) -> int:
+        """Estimate request tokens: 16kHz mono 16-bit WAV is 32KB/s, Gemini bills 32 tokens/s"""
+        return audio_size_bytes // 1000 + self.max_output_tokens
+    
     def _get_default_audio_analysis(self, audio_path: str, error_message: str) -> Dict[str, Any]:
         """Return default analysis when Gemini API fails"""
         logger.warning(f"Returning default audio analysis due to: {error_message}")
@@ -380,17 +389,22 @@ SUMMARY: [brief summary of audio content]
         video_file = Path(video_path)
         temp_audio_path = video_file.parent / f"temp_{video_file.stem}_audio.wav"
         
-        # Method 1: Try FFmpeg first (best quality)
+        # Method 1: Try PyAV first (decodes in-process, no ffmpeg subprocess)
+        if self._extract_with_pyav(video_path, str(temp_audio_path)):
+            logger.info("Audio extracted successfully with PyAV")
+            return str(temp_audio_path)
+        
+        # Method 2: Try FFmpeg command line
         if self._extract_with_ffmpeg(video_path, str(temp_audio_path)):
             logger.info("Audio extracted successfully with FFmpeg")
             return str(temp_audio_path)
         
-        # Method 2: Try ffmpeg-python
+        # Method 3: Try ffmpeg-python
         if self._extract_with_ffmpeg_python(video_path, str(temp_audio_path)):
             logger.info("Audio extracted successfully with ffmpeg-python")
             return str(temp_audio_path)
         
-        # Method 3: Try moviepy as fallback
+        # Method 4: Try moviepy as fallback
         if self._extract_with_moviepy(video_path, str(temp_audio_path)):
             logger.info("Audio extracted successfully with moviepy")
             return str(temp_audio_path)
@@ -398,6 +412,47 @@ SUMMARY: [brief summary of audio content]
         logger.error("All audio extraction methods failed")
         return None
     
+    def _extract_with_pyav(self, video_path: str, audio_path: str) -> bool:
+        """Extract audio in-process using PyAV (libav bindings)."""
+        try:
+            import av
+        except ImportError:
+            logger.warning("PyAV library not available")
+            return False
+        
+        try:
+            with av.open(video_path) as container:
+                if not container.streams.audio:
+                    logger.warning(f"No audio stream found in {video_path}")
+                    return False
+                
+                audio_stream = container.streams.audio[0]
+                # Same output format as the FFmpeg path: 16kHz mono PCM s16le
+                resampler = av.AudioResampler(format='s16', layout='mono', rate=16000)
+                
+                with wave.open(audio_path, 'wb') as wav_file:
+                    wav_file.setnchannels(1)
+                    wav_file.setsampwidth(2)
+                    wav_file.setframerate(16000)
+                    
+                    for frame in container.decode(audio_stream):
+                        for resampled in resampler.resample(frame):
+                            wav_file.writeframes(resampled.to_ndarray().tobytes())
+                    
+                    # Flush samples buffered inside the resampler
+                    for resampled in resampler.resample(None):
+                        wav_file.writeframes(resampled.to_ndarray().tobytes())
+            
+            if os.path.exists(audio_path):
+                file_size = os.path.getsize(audio_path)
+                logger.info(f"PyAV extraction successful: {audio_path} ({file_size} bytes)")
+                return True
+            return False
+            
+        except Exception as e:
+            logger.warning(f"PyAV extraction error: {e}")
+            return False
+    
     def _extract_with_ffmpeg(self, video_path: str, audio_path: str) -> bool:
         """Extract audio using FFmpeg command line tool."""
         try:
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_short_average_watch_percentage'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='view',
+            index=models.Index(fields=['user', '-updated_at'], name='api_view_user_id_6fd18a_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:53
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_view_user_updated_at_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='short',
+            index=models.Index(fields=['author', 'is_active', '-created_at'], name='api_short_author__5080bf_idx'),
+        ),
+    ]
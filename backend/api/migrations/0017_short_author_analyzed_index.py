@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_short_author_active_created_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='short',
+            index=models.Index(condition=models.Q(('video_analysis_status', 'completed')), fields=['author', '-video_analysis_processed_at'], name='short_author_analyzed_idx'),
+        ),
+    ]
@@ -1,5 +1,7 @@
 from django.db import models
+from django.db.models import Avg, Q
 from django.contrib.auth.models import User
+from django.utils import timezone
 from decimal import Decimal
 import uuid
 import os
@@ -95,12 +97,32 @@ class Short(models.Model):
     moderated_at = models.DateTimeField(blank=True, null=True, help_text="When moderation was performed")
     moderation_reason = models.TextField(blank=True, null=True, help_text="Reason for moderation action")
     
+    # Fields written by the calculate_*_reward methods
+    REWARD_FIELDS = [
+        'main_reward_score', 'ai_bonus_percentage', 'ai_bonus_reward',
+        'final_reward_score', 'reward_calculated_at',
+    ]
+    
+    # Large text/JSON fields that engagement and reward code paths never read
+    HEAVY_FIELDS = [
+        'description', 'transcript', 'video_analysis_summary', 'video_analysis_error',
+        'video_content_categories', 'video_detailed_breakdown', 'video_demographic_analysis',
+        'moderation_reason',
+    ]
+    
     class Meta:
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['-created_at']),
             models.Index(fields=['author']),
             models.Index(fields=['view_count']),
+            models.Index(fields=['author', 'is_active', '-created_at']),
+            # Partial index for the per-creator analysis report
+            models.Index(
+                fields=['author', '-video_analysis_processed_at'],
+                name='short_author_analyzed_idx',
+                condition=Q(video_analysis_status='completed'),
+            ),
         ]
     
     def __str__(self):
@@ -261,14 +283,10 @@ class Short(models.Model):
         self.like_count = self.like_count_calculated
         self.comment_count = self.comment_count_calculated
         
-        # Calculate average watch percentage from views
-        views = self.views.all()
-        if views:
-            total_watch_percentage = sum(view.watch_percentage for view in views if view.watch_percentage is not None)
-            valid_views = [view for view in views if view.watch_percentage is not None]
-            self.average_watch_percentage = total_watch_percentage / len(valid_views) if valid_views else 0.0
-        else:
-            self.average_watch_percentage = 0.0
+        # Calculate average watch percentage from views in the database
+        self.average_watch_percentage = self.views.aggregate(
+            average=Avg('watch_percentage')
+        )['average'] or 0.0
         
         self.save(update_fields=['like_count', 'comment_count', 'average_watch_percentage'])
 
@@ -393,7 +411,6 @@ class Short(models.Model):
             self.calculate_final_reward_score()
             
             # Update timestamp
-            from django.utils import timezone
             self.reward_calculated_at = timezone.now()
             
             # Save all changes
@@ -424,7 +441,6 @@ class Short(models.Model):
         self.calculate_final_reward_score()
         
         # Update timestamp
-        from django.utils import timezone
         self.reward_calculated_at = timezone.now()
         
         # Save all changes
@@ -460,8 +476,6 @@ class Short(models.Model):
         - Automatic moderation is only used for flagging content for review
         - If no manual moderation has been applied, moderation adjustment = 0%
         """
-        from django.utils import timezone
-        
         # Calculate all components
         main_score = self.calculate_main_reward_score()
         ai_bonus_pct = self.calculate_ai_bonus_percentage()  # This also sets ai_bonus_reward
@@ -565,6 +579,9 @@ class Comment(models.Model):
 
     @property
     def reply_count(self):
+        # List queries annotate active_reply_count to avoid one COUNT per comment
+        if hasattr(self, 'active_reply_count'):
+            return self.active_reply_count
         return self.replies.filter(is_active=True).count()
 
 
@@ -594,6 +611,7 @@ class View(models.Model):
             models.Index(fields=['user', 'short']),
             models.Index(fields=['session_id']),
             models.Index(fields=['watch_percentage']),
+            models.Index(fields=['user', '-updated_at']),
         ]
         # Unique constraint to prevent duplicate views per user/session
         unique_together = [['user', 'short', 'session_id']]
@@ -754,11 +772,11 @@ class Transaction(models.Model):
         """Calculate cryptographic hash for this transaction"""
         transaction_data = {
             'id': str(self.id),
-            'wallet_id': self.wallet.id,
+            'wallet_id': self.wallet_id,
             'transaction_type': self.transaction_type,
             'amount': str(self.amount),
             'description': self.description,
-            'related_short_id': str(self.related_short.id) if self.related_short else None,
+            'related_short_id': str(self.related_short_id) if self.related_short_id else None,
             'previous_hash': self.previous_hash,
             'timestamp': self.created_at.isoformat() if self.created_at else datetime.now().isoformat(),
             'nonce': self.nonce
@@ -770,7 +788,7 @@ class Transaction(models.Model):
     def generate_merkle_root(self):
         """Generate Merkle root for transaction verification"""
         # Simplified Merkle root (in production, you'd include multiple transactions)
-        data = f"{self.transaction_hash}{self.wallet.id}{self.amount}"
+        data = f"{self.transaction_hash}{self.wallet_id}{self.amount}"
         return hashlib.sha256(data.encode()).hexdigest()
 
     def save(self, *args, **kwargs):
@@ -808,17 +826,29 @@ class Transaction(models.Model):
         calculated_hash = self.calculate_hash()
         return calculated_hash == self.transaction_hash
 
-    def get_chain_validity(self):
-        """Check if this transaction is properly chained to the previous one"""
+    def get_chain_validity(self, verified_hashes=None):
+        """
+        Check if this transaction is properly chained to the previous one
+
+        verified_hashes optionally maps transaction_hash to verify_integrity()
+        for this wallet's transactions; checks over a whole wallet share it so
+        each predecessor is fetched and re-hashed at most once.
+        """
         if not self.previous_hash:
             return True  # Genesis transaction
+
+        if verified_hashes is not None and self.previous_hash in verified_hashes:
+            return verified_hashes[self.previous_hash]
             
         previous_tx = Transaction.objects.filter(
-            wallet=self.wallet,
+            wallet_id=self.wallet_id,
             transaction_hash=self.previous_hash
-        ).first()
+        ).defer('digital_signature').first()
         
-        return previous_tx is not None and previous_tx.verify_integrity()
+        valid = previous_tx is not None and previous_tx.verify_integrity()
+        if verified_hashes is not None:
+            verified_hashes[self.previous_hash] = valid
+        return valid
 
 
 class AuditLog(models.Model):
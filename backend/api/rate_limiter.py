@@ -0,0 +1,79 @@
+"""
+Rate limiting for outbound Gemini API calls
+
+Gemini enforces requests-per-minute (RPM) and tokens-per-minute (TPM) quotas
+per project and model. Throttling on our side keeps batch jobs from burning
+round-trips on 429 responses.
+"""
+
+import logging
+import threading
+import time
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket enforcing an RPM and a TPM quota.
+
+    Each call reserves its share of the quota immediately (the allowance may
+    go negative) and then sleeps until that reservation is covered, so
+    concurrent callers are released in arrival order.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.request_allowance = float(requests_per_minute)
+        self.token_allowance = float(tokens_per_minute)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, estimated_tokens: int = 0) -> float:
+        """
+        Block until a request of estimated_tokens fits within both quotas
+
+        Returns:
+            Seconds spent waiting
+        """
+        # A single request larger than the whole TPM quota can only wait a full minute
+        estimated_tokens = min(estimated_tokens, self.tokens_per_minute)
+
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self.last_refill
+            self.last_refill = now
+
+            self.request_allowance = min(
+                self.requests_per_minute,
+                self.request_allowance + elapsed * self.requests_per_minute / 60
+            )
+            self.token_allowance = min(
+                self.tokens_per_minute,
+                self.token_allowance + elapsed * self.tokens_per_minute / 60
+            )
+
+            self.request_allowance -= 1
+            self.token_allowance -= estimated_tokens
+
+            wait = max(
+                0.0,
+                -self.request_allowance * 60 / self.requests_per_minute,
+                -self.token_allowance * 60 / self.tokens_per_minute,
+            )
+
+        if wait > 0:
+            logger.info("Gemini rate limit reached, waiting %.1fs", wait)
+            time.sleep(wait)
+        return wait
+
+
+# Shared by the audio and video services: both call the same model, so they
+# draw from the same project quota
+gemini_rate_limiter = TokenBucket(
+    requests_per_minute=settings.GEMINI_REQUESTS_PER_MINUTE,
+    tokens_per_minute=settings.GEMINI_TOKENS_PER_MINUTE,
+)
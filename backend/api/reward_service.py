@@ -25,6 +25,7 @@ from django.db import transaction
 from django.db.models import Sum, Q
 from django.contrib.auth.models import User
 from .models import Short, Transaction, Wallet, AuditLog, MonthlyPayout
+from .signals import invalidate_monthly_points_totals
 
 logger = logging.getLogger(__name__)
 
@@ -141,7 +142,7 @@ class MonthlyRevenueShareService:
             self.logger.error(f"Error confirming transaction {transaction_obj.id}: {e}")
             return False
     
-    def get_monthly_creator_points(self, year: int, month: int) -> Dict:
+    def get_monthly_creator_points(self, year: int, month: int, creator: Optional[User] = None) -> Dict:
         """
         Get all creator points for a specific month with average-based calculation.
         
@@ -153,6 +154,9 @@ class MonthlyRevenueShareService:
         This ensures creators are rewarded based on average quality per video,
         not just total volume of content.
         
+        Args:
+            creator: Limit the result to this creator's shorts
+        
         Returns:
             Dict with creator_id -> averaged_points mapping
         """
@@ -169,6 +173,8 @@ class MonthlyRevenueShareService:
             Q(created_at__date__lt=end_date) &
             Q(is_active=True)
         )
+        if creator is not None:
+            monthly_shorts = monthly_shorts.filter(author=creator)
         
         creator_data = {}
         for short in monthly_shorts:
@@ -255,20 +261,22 @@ class MonthlyRevenueShareService:
                     end_date = datetime(year, month + 1, 1).date()
                 query &= Q(created_at__date__gte=start_date) & Q(created_at__date__lt=end_date)
             
-            shorts_to_calculate = Short.objects.filter(query)
+            shorts_to_calculate = (
+                Short.objects.filter(query)
+                .select_related('author')
+                .defer(*Short.HEAVY_FIELDS)
+            )
             
             calculated_count = 0
             error_count = 0
             results = []
+            calculated_shorts = []
             
             for short in shorts_to_calculate:
                 try:
                     # Use the model's point calculation method
                     points = short.calculate_final_reward_score()
-                    short.save(update_fields=[
-                        'main_reward_score', 'ai_bonus_percentage', 'ai_bonus_reward',
-                        'final_reward_score', 'reward_calculated_at'
-                    ])
+                    calculated_shorts.append(short)
                     
                     calculated_count += 1
                     results.append({
@@ -293,6 +301,11 @@ class MonthlyRevenueShareService:
                         'error': str(e)
                     })
             
+            # Write all calculated scores in batched UPDATEs instead of one save per short
+            Short.objects.bulk_update(calculated_shorts, Short.REWARD_FIELDS, batch_size=500)
+            # bulk_update skips post_save, so drop the affected months' cached points here
+            invalidate_monthly_points_totals(calculated_shorts)
+            
             self.logger.info(
                 f"Bulk points calculation completed: "
                 f"{calculated_count} calculated, {error_count} errors"
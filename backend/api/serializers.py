@@ -1,9 +1,27 @@
+import copy
 from django.contrib.auth.models import User
 from rest_framework import serializers
 from django.core.validators import FileExtensionValidator
 from .models import Note, Short, Like, Comment, View, Wallet, Transaction, AuditLog
 
 
+class CachedFieldsMixin:
+    """
+    Build a ModelSerializer's fields from model introspection once per class
+    and hand each serializer instance fresh copies of them.
+    """
+    _fields_cache = {}
+
+    def get_fields(self):
+        cached = CachedFieldsMixin._fields_cache.get(self.__class__)
+        if cached is None:
+            cached = super().get_fields()
+            CachedFieldsMixin._fields_cache[self.__class__] = cached
+        # bind() sets per-instance state on each field, so every serializer gets its
+        # own field objects; their read-only validators and kwargs can be shared
+        return {name: copy.copy(field) for name, field in cached.items()}
+
+
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
@@ -24,13 +42,20 @@ class UserProfileSerializer(serializers.ModelSerializer):
         model = User
         fields = ["id", "username", "date_joined", "shorts_count", "total_likes", "total_views"]
     
+    # Profile and short-detail queries annotate these totals up front
     def get_shorts_count(self, obj):
+        if hasattr(obj, 'active_shorts_count'):
+            return obj.active_shorts_count
         return obj.shorts.filter(is_active=True).count()
     
     def get_total_likes(self, obj):
+        if hasattr(obj, 'active_total_likes'):
+            return obj.active_total_likes or 0
         return sum(short.like_count for short in obj.shorts.filter(is_active=True))
     
     def get_total_views(self, obj):
+        if hasattr(obj, 'active_total_views'):
+            return obj.active_total_views or 0
         return sum(short.view_count for short in obj.shorts.filter(is_active=True))
 
 
@@ -70,6 +95,8 @@ class ShortSerializer(serializers.ModelSerializer):
         extra_kwargs = {"author": {"read_only": True}}
     
     def get_is_liked(self, obj):
+        if hasattr(obj, 'liked_by_me'):
+            return obj.liked_by_me
         user = self.context.get('request').user
         if user.is_authenticated:
             return Like.objects.filter(user=user, short=obj).exists()
@@ -92,6 +119,9 @@ class ShortListSerializer(serializers.ModelSerializer):
         extra_kwargs = {"author": {"read_only": True}}
 
     def get_is_liked(self, obj):
+        # ShortsListView annotates liked_by_me for authenticated users
+        if hasattr(obj, 'liked_by_me'):
+            return obj.liked_by_me
         user = self.context.get('request').user
         if user and user.is_authenticated:
             return Like.objects.filter(user=user, short=obj).exists()
@@ -128,7 +158,7 @@ class LikeSerializer(serializers.ModelSerializer):
         extra_kwargs = {"user": {"read_only": True}, "short": {"read_only": True}}
 
 
-class NoteSerializer(serializers.ModelSerializer):
+class NoteSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Note
         fields = ["id", "title", "content", "created_at", "author"]
@@ -3,61 +3,219 @@ Django signals for automatic reward calculation and moderation flagging
 """
 from django.db.models.signals import post_save, post_delete, pre_save
 from django.dispatch import receiver
+from django.db import transaction
+from django.core.cache import caches
+from django.utils import timezone
+from django.db.models import F, OuterRef, Subquery, Sum, Value, DecimalField
+from django.db.models.functions import Coalesce
 from .models import Short, Comment, Like, Transaction, Wallet, View
+from .comment_analysis_service import CommentAnalysisService
 from decimal import Decimal
 import logging
+import threading
+import weakref
+from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
 
+# Short fields written when a video/audio AI analysis completes
+ANALYSIS_FIELDS = frozenset({'video_overall_score', 'audio_quality_score'})
+
+# Threads whose caller recalculates rewards itself once all analyses finish
+_deferred_rewards = threading.local()
+
+
+@contextmanager
+def defer_reward_calculation():
+    """
+    Skip the analysis-triggered reward calculation for saves on this thread
+    """
+    _deferred_rewards.active = True
+    try:
+        yield
+    finally:
+        _deferred_rewards.active = False
+
+
 @receiver(post_save, sender=Short)
-def auto_calculate_rewards_on_analysis_completion(sender, instance, created, **kwargs):
+def auto_calculate_rewards_on_analysis_completion(sender, instance, created, update_fields=None, **kwargs):
     """
     Automatically calculate rewards when AI analysis scores are updated
     """
-    if not created:  # Only for updates, not new creations
-        # Check if this is an analysis update by looking at specific fields
-        if hasattr(instance, '_analysis_just_completed'):
-            logger.info(f"Analysis completed for Short {instance.id}, triggering auto-reward calculation")
-            instance.auto_calculate_rewards_if_ready()
+    if getattr(_deferred_rewards, 'active', False):
+        return
+
+    # Only analysis saves pass these fields; the reward save itself uses a full save()
+    if not created and update_fields and ANALYSIS_FIELDS & set(update_fields):
+        logger.info("Analysis completed for Short %s, triggering auto-reward calculation", instance.id)
+        instance.auto_calculate_rewards_if_ready()
+
+
+# Short fields shown in the per-creator video analysis report
+REPORT_FIELDS = frozenset({
+    'title', 'is_active', 'video_analysis_status', 'video_quality_score',
+    'video_engagement_prediction', 'video_sentiment_score', 'video_content_categories',
+    'video_analysis_summary', 'video_analysis_processed_at',
+})
+
+
+def video_analysis_report_cache_key(user_id):
+    return f'video-analysis-report:{user_id}'
+
+
+def invalidate_video_analysis_reports(user_ids):
+    """Drop the cached analysis reports of user_ids; bulk writers call this directly"""
+    caches['reports'].delete_many([video_analysis_report_cache_key(user_id) for user_id in set(user_ids)])
+
+
+@receiver(post_save, sender=Short)
+def invalidate_report_on_short_change(sender, instance, update_fields=None, **kwargs):
+    """
+    Drop the author's analysis report whenever a save touches a reported field,
+    whichever view, admin action or command wrote it
+    """
+    if update_fields is None or REPORT_FIELDS & set(update_fields):
+        invalidate_video_analysis_reports([instance.author_id])
+
+
+@receiver(post_delete, sender=Short)
+def invalidate_report_on_short_delete(sender, instance, **kwargs):
+    invalidate_video_analysis_reports([instance.author_id])
+
+
+def monthly_points_total_cache_key(year, month):
+    return f'monthly-points-total:{year}:{month}'
+
+
+def invalidate_monthly_points_totals(shorts):
+    """
+    Drop the cached per-creator points of every month the shorts were created in;
+    bulk writers that skip post_save call this directly
+    """
+    months = {(created_at.year, created_at.month) for created_at in
+              (timezone.localtime(short.created_at) for short in shorts)}
+    caches['reports'].delete_many([monthly_points_total_cache_key(year, month) for year, month in months])
+
+
+@receiver(post_save, sender=Short)
+@receiver(post_delete, sender=Short)
+def invalidate_monthly_points_on_deactivation(sender, instance, update_fields=None, **kwargs):
+    """
+    Drop the month's cached per-creator points when a short leaves it. Engagement
+    saves rescore shorts on every view and like, so they don't invalidate; the
+    earnings view uses the caller's fresh points and the timeout bounds the rest
+    """
+    if kwargs.get('signal') is post_delete or (update_fields and 'is_active' in update_fields):
+        invalidate_monthly_points_totals([instance])
+
+
+# Thread's open comment batch, held weakly: the on_commit callback is its only
+# strong reference, so a rollback that discards the callback also ends the batch
+_comment_batch = threading.local()
+
+
+class _PendingCommentChanges:
+    """
+    Comment changes queued for one transaction, flushed by its on_commit callback
+    """
+
+    def __init__(self):
+        # short_id -> {comment_id: needs_analysis}
+        self.changes = {}
+
+    @classmethod
+    def current(cls):
+        """Return the batch of the open transaction on this thread, if any"""
+        ref = getattr(_comment_batch, 'ref', None)
+        pending = ref() if ref is not None else None
+        if pending is None or not transaction.get_connection().in_atomic_block:
+            return None
+        return pending
+
+    def register(self):
+        _comment_batch.ref = weakref.ref(self)
+        # Outside a transaction this runs immediately
+        transaction.on_commit(self)
+
+    def add(self, comment, needs_analysis):
+        short_changes = self.changes.setdefault(comment.short_id, {})
+        short_changes[comment.id] = short_changes.get(comment.id, False) or needs_analysis
+
+    def __call__(self):
+        # The transaction is over, so later changes start a new batch
+        _comment_batch.ref = None
+        _flush_pending_comment_changes(self.changes)
 
 
 @receiver(post_save, sender=Comment)
 def update_rewards_on_comment_change(sender, instance, created, **kwargs):
     """
-    Recalculate AI bonus and check moderation when comments change
+    Recalculate AI bonus and check moderation when comments change.
+    Changes are coalesced per transaction so bulk comment imports only
+    recompute each Short once.
+    """
+    needs_analysis = created or instance.sentiment_score is None
+
+    pending = _PendingCommentChanges.current()
+    if pending is not None:
+        pending.add(instance, needs_analysis)
+        return
+
+    # First change in this transaction: register one callback for all of them.
+    # Outside a transaction on_commit runs immediately, so queue before registering.
+    pending = _PendingCommentChanges()
+    pending.add(instance, needs_analysis)
+    pending.register()
+
+
+def _flush_pending_comment_changes(pending):
+    """
+    Analyze queued comments and update each affected Short once
     """
+    if not pending:
+        return
+
+    comment_service = None
     try:
-        short = instance.short
-        
-        # Update cached comment count first
-        short.comment_count = short.comment_count_calculated
-        short.save(update_fields=['comment_count'])
-        
-        # Recalculate comment analysis score for the short
-        from .comment_analysis_service import CommentAnalysisService
         comment_service = CommentAnalysisService()
-        
-        # Analyze the new/updated comment
-        if created or instance.sentiment_score is None:
-            comment_service.analyze_comment_instance(instance)
-        
-        # Update aggregate score for the short
-        comment_service.update_short_aggregate_score(short)
-        
-        # Check moderation flag
-        short.check_and_update_moderation_flag()
-        
-        # If rewards were already calculated, recalculate AI bonus
-        if short.reward_calculated_at:
-            short.calculate_ai_bonus_percentage()
-            short.calculate_final_reward_score()
-            short.save()
-            
-        logger.info(f"Updated rewards for Short {short.id} after comment change")
-        
+
+        # Analyze the new/updated comments in one batch
+        comment_ids = [
+            comment_id
+            for short_changes in pending.values()
+            for comment_id, needs_analysis in short_changes.items()
+            if needs_analysis
+        ]
+        if comment_ids:
+            comment_service.analyze_many(list(Comment.objects.filter(id__in=comment_ids)))
     except Exception as e:
-        logger.error(f"Error updating rewards after comment change: {e}")
+        # Counts and moderation below still follow the committed comments
+        logger.error("Error analyzing comments after comment change: %s", e)
+
+    for short in Short.objects.filter(id__in=pending.keys()):
+        try:
+            # Update cached comment count first
+            short.comment_count = short.comment_count_calculated
+            short.save(update_fields=['comment_count'])
+
+            # Update aggregate score for the short
+            if comment_service is not None:
+                comment_service.update_short_aggregate_score(short)
+
+            # Check moderation flag
+            short.check_and_update_moderation_flag()
+
+            # If rewards were already calculated, recalculate AI bonus
+            if short.reward_calculated_at:
+                short.calculate_ai_bonus_percentage()
+                short.calculate_final_reward_score()
+                short.save()
+
+            logger.info("Updated rewards for Short %s after comment change", short.id)
+
+        except Exception as e:
+            logger.error("Error updating rewards after comment change: %s", e)
 
 
 # Custom signal for when analysis is completed
@@ -72,21 +230,18 @@ def on_analysis_completed(sender, short_id, analysis_type, **kwargs):
     """
     try:
         short = Short.objects.get(id=short_id)
-        logger.info(f"{analysis_type} analysis completed for Short {short.id}")
-        
-        # Mark that analysis just completed
-        short._analysis_just_completed = True
+        logger.info("%s analysis completed for Short %s", analysis_type, short.id)
         
         # Try to auto-calculate rewards
         if short.auto_calculate_rewards_if_ready():
-            logger.info(f"Auto-calculated rewards for Short {short.id}")
+            logger.info("Auto-calculated rewards for Short %s", short.id)
         else:
-            logger.info(f"Not all analysis complete yet for Short {short.id}")
+            logger.info("Not all analysis complete yet for Short %s", short.id)
             
     except Short.DoesNotExist:
-        logger.error(f"Short {short_id} not found for analysis completion signal")
+        logger.error("Short %s not found for analysis completion signal", short_id)
     except Exception as e:
-        logger.error(f"Error handling analysis completion: {e}")
+        logger.error("Error handling analysis completion: %s", e)
 
 
 @receiver(post_save, sender=Like)
@@ -94,10 +249,14 @@ def update_like_count_on_like_save(sender, instance, created, **kwargs):
     """
     Update cached like_count when a Like is created and recalculate rewards
     """
+    if not created:
+        return
+
     try:
+        # Atomic increment instead of a COUNT(*) + write that loses concurrent likes
+        Short.objects.filter(pk=instance.short_id).update(like_count=F('like_count') + 1)
         short = instance.short
-        short.like_count = short.like_count_calculated
-        short.save(update_fields=['like_count'])
+        short.refresh_from_db(fields=['like_count'])
         
         # Recalculate rewards if they've been calculated before
         if short.reward_calculated_at:
@@ -105,14 +264,14 @@ def update_like_count_on_like_save(sender, instance, created, **kwargs):
             short.calculate_ai_bonus_percentage() 
             short.calculate_final_reward_score()
             short.save()
-            logger.info(f"Recalculated complete rewards for Short {short.id} after like change")
+            logger.info("Recalculated complete rewards for Short %s after like change", short.id)
         else:
             # Try auto-calculation if this is the first time
             short.auto_calculate_rewards_if_ready()
             
-        logger.debug(f"Updated like_count for Short {short.id} after like save")
+        logger.debug("Updated like_count for Short %s after like save", short.id)
     except Exception as e:
-        logger.error(f"Error updating like_count after like save: {e}")
+        logger.error("Error updating like_count after like save: %s", e)
 
 
 @receiver(post_delete, sender=Like)
@@ -121,9 +280,9 @@ def update_like_count_on_like_delete(sender, instance, **kwargs):
     Update cached like_count when a Like is deleted and recalculate rewards
     """
     try:
+        Short.objects.filter(pk=instance.short_id).update(like_count=F('like_count') - 1)
         short = instance.short
-        short.like_count = short.like_count_calculated
-        short.save(update_fields=['like_count'])
+        short.refresh_from_db(fields=['like_count'])
         
         # Recalculate rewards if they've been calculated before
         if short.reward_calculated_at:
@@ -131,11 +290,11 @@ def update_like_count_on_like_delete(sender, instance, **kwargs):
             short.calculate_ai_bonus_percentage()
             short.calculate_final_reward_score()
             short.save()
-            logger.info(f"Recalculated complete rewards for Short {short.id} after like deletion")
+            logger.info("Recalculated complete rewards for Short %s after like deletion", short.id)
             
-        logger.debug(f"Updated like_count for Short {short.id} after like delete")
+        logger.debug("Updated like_count for Short %s after like delete", short.id)
     except Exception as e:
-        logger.error(f"Error updating like_count after like delete: {e}")
+        logger.error("Error updating like_count after like delete: %s", e)
 
 
 @receiver(post_delete, sender=Comment)
@@ -147,36 +306,50 @@ def update_comment_count_on_comment_delete(sender, instance, **kwargs):
         short = instance.short
         short.comment_count = short.comment_count_calculated
         short.save(update_fields=['comment_count'])
-        logger.debug(f"Updated comment_count for Short {short.id} after comment delete")
+        logger.debug("Updated comment_count for Short %s after comment delete", short.id)
     except Exception as e:
-        logger.error(f"Error updating comment_count after comment delete: {e}")
+        logger.error("Error updating comment_count after comment delete: %s", e)
+
+
+# Transaction.save() writes these once the row exists; amounts are unchanged
+HASH_FIELDS = frozenset({'transaction_hash', 'merkle_root', 'nonce'})
+
+
+def recalculate_wallet_totals(instance):
+    """
+    Recompute a wallet's balance and total_earnings from its transactions in one UPDATE
+    """
+    wallet_transactions = Transaction.objects.filter(wallet=OuterRef('pk')).order_by().values('wallet')
+    total_amount = wallet_transactions.annotate(total=Sum('amount')).values('total')
+    total_credits = wallet_transactions.filter(amount__gt=0).annotate(total=Sum('amount')).values('total')
+    zero = Value(Decimal('0.00'), output_field=DecimalField())
+
+    # Balance is the sum of ALL transactions (confirmed or not) to avoid stale balances
+    # when confirmations fail or are delayed; lifetime earnings = sum of positive credits
+    Wallet.objects.filter(pk=instance.wallet_id).update(
+        balance=Coalesce(Subquery(total_amount), zero),
+        total_earnings=Coalesce(Subquery(total_credits), zero),
+    )
+
+    # Keep a wallet the caller is still holding in step with the database
+    if Transaction.wallet.is_cached(instance):
+        instance.wallet.refresh_from_db(fields=['balance', 'total_earnings'])
+
+    logger.debug("Recalculated totals for wallet %s", instance.wallet_id)
 
 
 @receiver(post_save, sender=Transaction)
-def update_wallet_on_transaction_save(sender, instance, created, **kwargs):
+def update_wallet_on_transaction_save(sender, instance, created, update_fields=None, **kwargs):
     """
     Update wallet balance and total_earnings when a transaction is created or updated
     """
+    if update_fields and HASH_FIELDS.issuperset(update_fields):
+        return
+
     try:
-        wallet = instance.wallet
-        
-        # Calculate totals from ALL transactions (confirmed or not) to avoid stale balances
-        # when confirmations fail or are delayed.
-        txs = wallet.transactions.all()
-        total_balance = sum((t.amount for t in txs), Decimal('0.00'))
-        
-        # Lifetime earnings = sum of positive credits
-        total_earnings = sum((t.amount for t in txs if t.amount > 0), Decimal('0.00'))
-        
-        # Persist updated wallet totals
-        wallet.balance = total_balance
-        wallet.total_earnings = total_earnings
-        wallet.save(update_fields=['balance', 'total_earnings'])
-        
-        logger.info(f"Updated wallet for {wallet.user.username}: balance=${total_balance}, total_earnings=${total_earnings}")
-        
+        recalculate_wallet_totals(instance)
     except Exception as e:
-        logger.error(f"Error updating wallet after transaction save: {e}")
+        logger.error("Error updating wallet after transaction save: %s", e)
 
 
 @receiver(post_delete, sender=Transaction)
@@ -185,21 +358,9 @@ def update_wallet_on_transaction_delete(sender, instance, **kwargs):
     Update wallet balance and total_earnings when a transaction is deleted
     """
     try:
-        wallet = instance.wallet
-        
-        # Recompute from ALL remaining transactions
-        txs = wallet.transactions.all()
-        total_balance = sum((t.amount for t in txs), Decimal('0.00'))
-        total_earnings = sum((t.amount for t in txs if t.amount > 0), Decimal('0.00'))
-        
-        wallet.balance = total_balance
-        wallet.total_earnings = total_earnings
-        wallet.save(update_fields=['balance', 'total_earnings'])
-        
-        logger.info(f"Updated wallet for {wallet.user.username} after transaction delete: balance=${total_balance}, total_earnings=${total_earnings}")
-        
+        recalculate_wallet_totals(instance)
     except Exception as e:
-        logger.error(f"Error updating wallet after transaction delete: {e}")
+        logger.error("Error updating wallet after transaction delete: %s", e)
 
 
 @receiver(post_save, sender=View)
@@ -219,14 +380,14 @@ def update_watch_percentage_on_view_save(sender, instance, created, **kwargs):
             short.calculate_ai_bonus_percentage()
             short.calculate_final_reward_score()
             short.save()
-            logger.info(f"Recalculated complete rewards for Short {short.id} after view update")
+            logger.info("Recalculated complete rewards for Short %s after view update", short.id)
         else:
             # Try auto-calculation if this is the first time
             short.auto_calculate_rewards_if_ready()
             
-        logger.debug(f"Updated average_watch_percentage for Short {short.id} after view save")
+        logger.debug("Updated average_watch_percentage for Short %s after view save", short.id)
     except Exception as e:
-        logger.error(f"Error updating average_watch_percentage after view save: {e}")
+        logger.error("Error updating average_watch_percentage after view save: %s", e)
 
 
 @receiver(post_delete, sender=View)
@@ -246,8 +407,8 @@ def update_watch_percentage_on_view_delete(sender, instance, **kwargs):
             short.calculate_ai_bonus_percentage()
             short.calculate_final_reward_score()
             short.save()
-            logger.info(f"Recalculated complete rewards for Short {short.id} after view deletion")
+            logger.info("Recalculated complete rewards for Short %s after view deletion", short.id)
             
-        logger.debug(f"Updated average_watch_percentage for Short {short.id} after view delete")
+        logger.debug("Updated average_watch_percentage for Short %s after view delete", short.id)
     except Exception as e:
-        logger.error(f"Error updating average_watch_percentage after view delete: {e}")
+        logger.error("Error updating average_watch_percentage after view delete: %s", e)
@@ -1,5 +1,5 @@
 import os
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.conf import settings
 from unittest.mock import patch, MagicMock
 
@@ -107,4 +107,1717 @@ class GeminiAudioServiceTests(TestCase):
         self.assertTrue(hasattr(gemini_audio_service, 'model_name'))
         
         # Test model name
-        self.assertEqual(gemini_audio_service.model_name, 'gemini-2.5-flash')
\ No newline at end of file
+        self.assertEqual(gemini_audio_service.model_name, 'gemini-2.5-flash')
+
+class CommentSignalCoalescingTests(TestCase):
+    """
+    Test that comment changes inside one transaction are processed once per Short.
+    """
+
+    def setUp(self):
+        """Set up a user and a short to comment on."""
+        from django.contrib.auth.models import User
+        from .models import Short
+
+        self.user = User.objects.create_user(username='commenter', password='pass')
+        self.short = Short.objects.create(author=self.user, video='videos/test.mp4')
+
+    @patch('api.signals.CommentAnalysisService')
+    def test_bulk_comments_flush_once(self, MockService):
+        """
+        Test that several comments saved in one transaction trigger a single batch.
+        """
+        from .models import Comment
+
+        mock_service = MockService.return_value
+
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(3):
+                Comment.objects.create(user=self.user, short=self.short, content=f"comment {i}")
+
+        mock_service.analyze_many.assert_called_once()
+        self.assertEqual(len(mock_service.analyze_many.call_args[0][0]), 3)
+        mock_service.update_short_aggregate_score.assert_called_once()
+
+        self.short.refresh_from_db()
+        self.assertEqual(self.short.comment_count, 3)
+
+    @patch('api.signals.CommentAnalysisService')
+    def test_one_callback_per_transaction(self, MockService):
+        """
+        Test that a bulk import registers a single on_commit callback.
+        """
+        from .models import Comment
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            for i in range(3):
+                Comment.objects.create(user=self.user, short=self.short, content=f"comment {i}")
+
+        self.assertEqual(len(callbacks), 1)
+
+    @patch('api.signals.CommentAnalysisService')
+    def test_rolled_back_changes_are_dropped(self, MockService):
+        """
+        Test that comments saved in a rolled-back transaction are not flushed by the next commit.
+        """
+        from django.db import transaction
+        from .models import Comment, Short
+
+        other_short = Short.objects.create(author=self.user, video='videos/other.mp4')
+        mock_service = MockService.return_value
+
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    Comment.objects.create(user=self.user, short=other_short, content="rolled back")
+                    raise RuntimeError('abort')
+            except RuntimeError:
+                pass
+            Comment.objects.create(user=self.user, short=self.short, content="kept")
+
+        analyzed = mock_service.analyze_many.call_args[0][0]
+        self.assertEqual([comment.content for comment in analyzed], ["kept"])
+        mock_service.update_short_aggregate_score.assert_called_once()
+        self.assertEqual(mock_service.update_short_aggregate_score.call_args[0][0].id, self.short.id)
+
+    @patch('api.signals.CommentAnalysisService')
+    def test_analysis_error_still_updates_counts(self, MockService):
+        """
+        Test that comment_count is refreshed even when sentiment analysis fails.
+        """
+        from .models import Comment
+
+        MockService.return_value.analyze_many.side_effect = RuntimeError('model unavailable')
+
+        with self.assertLogs('api.signals', level='ERROR'), self.captureOnCommitCallbacks(execute=True):
+            Comment.objects.create(user=self.user, short=self.short, content="hello")
+
+        self.short.refresh_from_db()
+        self.assertEqual(self.short.comment_count, 1)
+
+
+class AnalysisRewardSignalTests(TestCase):
+    """
+    Test that saving AI analysis scores triggers the automatic reward calculation.
+    """
+
+    def setUp(self):
+        """Set up a user and a short with no rewards calculated yet."""
+        from django.contrib.auth.models import User
+        from .models import Short
+
+        self.user = User.objects.create_user(username='creator', password='pass')
+        self.short = Short.objects.create(author=self.user, video='videos/test.mp4')
+
+    def test_analysis_score_save_calculates_rewards(self):
+        """
+        Test that an update_fields save of an analysis score calculates rewards.
+        """
+        self.short.audio_quality_score = 80.0
+        self.short.save(update_fields=['audio_quality_score'])
+
+        self.short.refresh_from_db()
+        self.assertIsNotNone(self.short.reward_calculated_at)
+        self.assertIsNotNone(self.short.final_reward_score)
+
+    def test_unrelated_save_does_not_calculate_rewards(self):
+        """
+        Test that saving non-analysis fields leaves rewards untouched.
+        """
+        self.short.title = 'Renamed'
+        self.short.save(update_fields=['title'])
+
+        self.short.refresh_from_db()
+        self.assertIsNone(self.short.reward_calculated_at)
+
+    def test_video_analysis_skips_empty_legacy_fields(self):
+        """
+        Test that applying a video analysis only writes legacy dicts when clearing old data.
+        """
+        from .views import _apply_video_analysis_result
+
+        result = {'success': True, 'quality_score': 70, 'overall_score': 65, 'summary': 'short', 'detailed_summary': 'long'}
+
+        update_fields = _apply_video_analysis_result(self.short, result)
+
+        self.assertNotIn('video_detailed_breakdown', update_fields)
+        self.assertEqual(self.short.video_analysis_summary, 'long')
+        self.assertEqual(self.short.video_technical_quality, 70)
+        self.assertEqual(self.short.video_content_focus, 70)
+
+        self.short.video_detailed_breakdown = {'old': 1}
+        update_fields = _apply_video_analysis_result(self.short, result)
+
+        self.assertIn('video_detailed_breakdown', update_fields)
+        self.assertEqual(self.short.video_detailed_breakdown, {})
+
+    @patch('api.views.gemini_video_service')
+    def test_video_analysis_on_lean_instance_avoids_extra_queries(self, mock_service):
+        """
+        Test that analysing a lean worker copy issues only the status and result UPDATEs.
+        """
+        from .signals import defer_reward_calculation
+        from .views import ShortCreateView
+
+        mock_service.is_available.return_value = True
+        mock_service.analyze_video.return_value = {'success': True, 'overall_score': 70}
+        view = ShortCreateView()
+        lean_short = view.load_for_analysis(self.short.id)
+
+        with defer_reward_calculation(), self.assertNumQueries(2):
+            view.process_video_analysis(lean_short)
+
+        self.short.refresh_from_db()
+        self.assertEqual(self.short.video_analysis_status, 'completed')
+        self.assertEqual(self.short.video_overall_score, 70)
+
+    def test_deferred_analysis_save_skips_rewards(self):
+        """
+        Test that analysis saves inside defer_reward_calculation leave rewards to the caller.
+        """
+        from .signals import defer_reward_calculation
+
+        with defer_reward_calculation():
+            self.short.audio_quality_score = 80.0
+            self.short.save(update_fields=['audio_quality_score'])
+
+        self.short.refresh_from_db()
+        self.assertIsNone(self.short.reward_calculated_at)
+
+
+    @patch('api.views.ANALYSIS_EXECUTOR')
+    def test_rewards_after_finished_analyses_run_on_the_pool(self, mock_executor):
+        """
+        Test that the reward calculation is queued on the pool even when the analyses already finished.
+        """
+        from concurrent.futures import Future
+        from .views import ShortCreateView
+
+        futures = [Future(), Future()]
+        for future in futures:
+            future.set_result(None)
+
+        ShortCreateView().calculate_rewards_when_done(self.short.id, futures)
+
+        mock_executor.submit.assert_called_once()
+        self.short.refresh_from_db()
+        self.assertIsNone(self.short.reward_calculated_at)
+
+        calculate_rewards, = mock_executor.submit.call_args[0]
+        calculate_rewards()
+
+        self.short.refresh_from_db()
+        self.assertIsNotNone(self.short.reward_calculated_at)
+
+
+class CommentAnalysisNotFoundTests(TestCase):
+    """
+    Test that comment analysis endpoints return 404 for missing objects.
+    """
+
+    def setUp(self):
+        """Authenticate a regular user against the API."""
+        from django.contrib.auth.models import User
+        from rest_framework.test import APIClient
+
+        self.user = User.objects.create_user(username='viewer', password='pass')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_missing_comment_returns_404(self):
+        """
+        Test that analyzing a nonexistent comment is a 404, not a 500.
+        """
+        response = self.client.post('/api/admin/analyze-comment/999999/')
+        self.assertEqual(response.status_code, 404)
+
+    def test_missing_short_summary_returns_404(self):
+        """
+        Test that summarizing a nonexistent short is a 404, not a 500.
+        """
+        response = self.client.get(
+            '/api/comment-sentiment-summary/00000000-0000-0000-0000-000000000000/'
+        )
+        self.assertEqual(response.status_code, 404)
+
+
+# In-memory stand-ins for every configured cache, so tests never touch the on-disk ones
+LOCMEM_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'gemini': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'gemini-tests'},
+    'reports': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'reports-tests'},
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CachedAudioAnalysisTests(TestCase):
+    """
+    Test the file-keyed cache around Gemini audio analysis.
+    """
+
+    def setUp(self):
+        """Create a temporary video file and start from an empty cache."""
+        import tempfile
+        from django.core.cache import caches
+
+        caches['gemini'].clear()
+        handle = tempfile.NamedTemporaryFile(suffix='.mp4', delete=False)
+        handle.write(b'fake video')
+        handle.close()
+        self.video_path = handle.name
+        self.addCleanup(os.remove, self.video_path)
+
+    @patch('api.views.gemini_audio_service')
+    def test_unchanged_file_reuses_result(self, mock_service):
+        """
+        Test that a second analysis of an unchanged file skips the Gemini call.
+        """
+        from .views import _cached_analyze_video_audio
+
+        mock_service.model_name = 'test-model'
+        mock_service.analyze_video_audio.return_value = {'success': True, 'audio_quality_score': 75.0}
+
+        first = _cached_analyze_video_audio(self.video_path)
+        second = _cached_analyze_video_audio(self.video_path)
+
+        self.assertEqual(first, second)
+        mock_service.analyze_video_audio.assert_called_once_with(self.video_path)
+
+    @patch('api.views.gemini_audio_service')
+    def test_force_and_errors_bypass_cache(self, mock_service):
+        """
+        Test that force re-runs the analysis and error results are not cached.
+        """
+        from .views import _cached_analyze_video_audio
+
+        mock_service.model_name = 'test-model'
+        mock_service.analyze_video_audio.return_value = {'success': False, 'error': 'quota'}
+
+        _cached_analyze_video_audio(self.video_path)
+        _cached_analyze_video_audio(self.video_path)
+        self.assertEqual(mock_service.analyze_video_audio.call_count, 2)
+
+        mock_service.analyze_video_audio.return_value = {'success': True, 'audio_quality_score': 75.0}
+        _cached_analyze_video_audio(self.video_path)
+        _cached_analyze_video_audio(self.video_path, force=True)
+        self.assertEqual(mock_service.analyze_video_audio.call_count, 4)
+
+    @patch('api.views._cached_analyze_video_audio')
+    def test_batch_analysis_keeps_order_and_errors(self, mock_analyze):
+        """
+        Test that concurrent batch analysis returns results in input order with per-file errors.
+        """
+        from pathlib import Path
+        from .views import _analyze_video_files
+
+        def fake_analyze(path, force=False):
+            if path.endswith('bad.mp4'):
+                raise RuntimeError('boom')
+            return {'audio_quality_score': 50.0, 'path': path}
+
+        mock_analyze.side_effect = fake_analyze
+        files = [Path(f'/videos/{name}.mp4') for name in ('a', 'bad', 'c')]
+
+        results = list(_analyze_video_files(files))
+
+        self.assertEqual([video_file for video_file, _, _ in results], files)
+        self.assertEqual(results[0][1]['path'], '/videos/a.mp4')
+        self.assertIsInstance(results[1][2], RuntimeError)
+        self.assertIsNone(results[2][2])
+        self.assertEqual(list(_analyze_video_files([])), [])
+
+    @patch('api.views.MAX_PARALLEL_AUDIO_ANALYSES', 1)
+    @patch('api.views._cached_analyze_video_audio')
+    def test_closed_batch_cancels_remaining_files(self, mock_analyze):
+        """
+        Test that closing the result stream early neither waits for nor starts the remaining files.
+        """
+        import threading
+        from pathlib import Path
+        from .views import _analyze_video_files
+
+        release = threading.Event()
+        second_started = threading.Event()
+
+        def fake_analyze(path, force=False):
+            if path.endswith('b.mp4'):
+                second_started.set()
+                release.wait(5)
+            return {'path': path}
+
+        mock_analyze.side_effect = fake_analyze
+        results = _analyze_video_files([Path(f'/videos/{name}.mp4') for name in ('a', 'b', 'c')])
+
+        next(results)
+        self.assertTrue(second_started.wait(5))
+        results.close()
+        release.set()
+
+        self.assertEqual(
+            [call.args[0] for call in mock_analyze.call_args_list], ['/videos/a.mp4', '/videos/b.mp4']
+        )
+
+
+class TokenBucketTests(TestCase):
+    """
+    Test the Gemini RPM/TPM token bucket.
+    """
+
+    @patch('api.rate_limiter.time')
+    def test_waits_once_request_quota_is_spent(self, mock_time):
+        """
+        Test that calls beyond the RPM quota wait for the allowance to refill.
+        """
+        from .rate_limiter import TokenBucket
+
+        mock_time.monotonic.return_value = 100.0
+        bucket = TokenBucket(requests_per_minute=2, tokens_per_minute=1000)
+
+        self.assertEqual(bucket.acquire(), 0.0)
+        self.assertEqual(bucket.acquire(), 0.0)
+        self.assertAlmostEqual(bucket.acquire(), 30.0)
+        mock_time.sleep.assert_called_once_with(30.0)
+
+    @patch('api.rate_limiter.time')
+    def test_waits_for_token_quota(self, mock_time):
+        """
+        Test that a request larger than the remaining TPM allowance waits for it.
+        """
+        from .rate_limiter import TokenBucket
+
+        mock_time.monotonic.return_value = 100.0
+        bucket = TokenBucket(requests_per_minute=100, tokens_per_minute=600)
+
+        self.assertEqual(bucket.acquire(600), 0.0)
+        self.assertAlmostEqual(bucket.acquire(300), 30.0)
+
+        # After a full minute both quotas have refilled
+        mock_time.monotonic.return_value = 190.0
+        self.assertEqual(bucket.acquire(600), 0.0)
+
+
+class EngagementCountTests(TestCase):
+    """
+    Test that like and comment endpoints keep the cached counts in sync.
+    """
+
+    def setUp(self):
+        """Create a short and an authenticated API client."""
+        from django.contrib.auth.models import User
+        from rest_framework.test import APIClient
+        from .models import Short
+
+        self.user = User.objects.create_user(username='fan', password='pass')
+        self.short = Short.objects.create(author=self.user, video='videos/test.mp4')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_toggle_like_updates_like_count(self):
+        """
+        Test that liking and unliking adjusts like_count and returns it.
+        """
+        url = f'/api/shorts/{self.short.id}/like/'
+
+        response = self.client.post(url)
+        self.assertEqual(response.data, {'liked': True, 'like_count': 1})
+
+        response = self.client.post(url)
+        self.assertEqual(response.data, {'liked': False, 'like_count': 0})
+
+        self.short.refresh_from_db()
+        self.assertEqual(self.short.like_count, 0)
+
+    def test_track_view_recalculates_rewards(self):
+        """
+        Test that a view increments view_count and refreshes previously calculated rewards.
+        """
+        self.short.auto_calculate_rewards_if_ready()
+        self.short.refresh_from_db()
+        self.assertEqual(self.short.main_reward_score, 0)
+
+        response = self.client.post(f'/api/shorts/{self.short.id}/view/')
+
+        self.assertEqual(response.data['view_count'], 1)
+        self.assertEqual(response.data['main_reward_score'], 1)
+        self.short.refresh_from_db()
+        self.assertEqual(self.short.view_count, 1)
+        self.assertEqual(self.short.main_reward_score, 1)
+
+    def test_get_comments_counts_active_replies(self):
+        """
+        Test that listed comments report only active replies.
+        """
+        from .models import Comment
+
+        comment = Comment.objects.create(user=self.user, short=self.short, content='Top')
+        Comment.objects.create(user=self.user, short=self.short, content='Reply', parent=comment)
+        Comment.objects.create(user=self.user, short=self.short, content='Hidden', parent=comment, is_active=False)
+
+        response = self.client.get(f'/api/shorts/{self.short.id}/comments/')
+
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]['reply_count'], 1)
+        self.assertEqual(response.data[0]['user']['username'], 'fan')
+
+    def test_shorts_list_reports_is_liked(self):
+        """
+        Test that the feed marks shorts liked by the requesting user.
+        """
+        from .models import Like, Short
+
+        other = Short.objects.create(author=self.user, video='videos/other.mp4')
+        Like.objects.create(user=self.user, short=self.short)
+
+        response = self.client.get('/api/shorts/')
+
+        liked = {item['id']: item['is_liked'] for item in response.data}
+        self.assertTrue(liked[str(self.short.id)])
+        self.assertFalse(liked[str(other.id)])
+
+    def test_track_view_unknown_short_returns_404(self):
+        """
+        Test that tracking a view on a missing or inactive short is a 404.
+        """
+        self.short.is_active = False
+        self.short.save(update_fields=['is_active'])
+
+        response = self.client.post(f'/api/shorts/{self.short.id}/view/')
+
+        self.assertEqual(response.status_code, 404)
+        self.short.refresh_from_db()
+        self.assertEqual(self.short.view_count, 0)
+
+    def test_watch_progress_counts_previous_sessions_as_rewatches(self):
+        """
+        Test that a new session on a watched short records earlier sessions as rewatches.
+        """
+        url = f'/api/shorts/{self.short.id}/watch-progress/'
+
+        first = self.client.post(url, {'current_position': 2, 'duration_watched': 2, 'session_id': 's1'}, format='json')
+        again = self.client.post(url, {'current_position': 3, 'duration_watched': 3, 'session_id': 's1'}, format='json')
+        second = self.client.post(url, {'current_position': 1, 'duration_watched': 1, 'session_id': 's2'}, format='json')
+
+        self.assertEqual(first.data['rewatch_count'], 0)
+        self.assertEqual(again.data['rewatch_count'], 0)
+        self.assertEqual(second.data['rewatch_count'], 1)
+
+    def test_watch_history_lists_most_recent_first(self):
+        """
+        Test that watch history returns one entry per session, newest first.
+        """
+        url = f'/api/shorts/{self.short.id}/watch-progress/'
+        self.client.post(url, {'current_position': 2, 'duration_watched': 2, 'session_id': 's1'}, format='json')
+        self.client.post(url, {'current_position': 1, 'duration_watched': 1, 'session_id': 's2'}, format='json')
+
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/watch-history/')
+
+        history = response.data['watch_history']
+        self.assertEqual(len(history), 2)
+        self.assertEqual(history[0]['short_id'], str(self.short.id))
+        self.assertEqual(history[0]['short_title'], 'Untitled')
+        self.assertEqual(history[0]['rewatch_count'], 1)
+
+    def test_video_analytics_cached_until_new_session(self):
+        """
+        Test that analytics are served from cache and refreshed when a new session starts.
+        """
+        url = f'/api/shorts/{self.short.id}/analytics/'
+
+        first = self.client.get(url)
+        # Only the access check; the analytics come from the cache
+        with self.assertNumQueries(1):
+            cached = self.client.get(url)
+        self.assertEqual(cached.data, first.data)
+
+        self.client.post(
+            f'/api/shorts/{self.short.id}/watch-progress/',
+            {'current_position': 1, 'duration_watched': 1, 'session_id': 's1'},
+            format='json'
+        )
+
+        refreshed = self.client.get(url)
+        self.assertEqual(first.data['analytics']['total_views'], 0)
+        self.assertEqual(refreshed.data['analytics']['total_views'], 1)
+
+    def test_cached_analytics_of_deactivated_short_are_not_served(self):
+        """
+        Test that deactivating a short hides its analytics even while they are cached.
+        """
+        url = f'/api/shorts/{self.short.id}/analytics/'
+
+        self.assertEqual(self.client.get(url).status_code, 200)
+        self.short.is_active = False
+        self.short.save(update_fields=['is_active'])
+
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_watch_progress_ticks_throttle_short_refresh(self):
+        """
+        Test that rapid progress ticks persist the view but refresh the short once per interval.
+        """
+        from .models import Short, View
+
+        Short.objects.filter(pk=self.short.pk).update(duration=100)
+        url = f'/api/shorts/{self.short.id}/watch-progress/'
+
+        self.client.post(url, {'current_position': 10, 'duration_watched': 10, 'session_id': 's1'}, format='json')
+        self.client.post(url, {'current_position': 20, 'duration_watched': 20, 'session_id': 's1'}, format='json')
+        self.client.post(url, {'current_position': 30, 'duration_watched': 30, 'session_id': 's1'}, format='json')
+
+        view = View.objects.get(short=self.short, session_id='s1')
+        self.assertEqual(view.max_watch_position, 30)
+        self.assertAlmostEqual(view.watch_percentage, 30)
+        self.short.refresh_from_db()
+        self.assertAlmostEqual(self.short.average_watch_percentage, 20)
+
+        # Completing the view always refreshes the short
+        self.client.post(url, {'current_position': 100, 'duration_watched': 100, 'session_id': 's1'}, format='json')
+        self.short.refresh_from_db()
+        self.assertAlmostEqual(self.short.average_watch_percentage, 100)
+
+    def test_watch_history_is_paginated(self):
+        """
+        Test that watch history returns bounded pages with a has_next flag.
+        """
+        url = f'/api/shorts/{self.short.id}/watch-progress/'
+        for session_id in ('s1', 's2', 's3'):
+            self.client.post(url, {'current_position': 1, 'duration_watched': 1, 'session_id': session_id}, format='json')
+
+        first_page = self.client.get('/api/watch-history/', {'page_size': 2})
+        last_page = self.client.get('/api/watch-history/', {'page_size': 2, 'page': 2})
+
+        self.assertEqual(len(first_page.data['watch_history']), 2)
+        self.assertTrue(first_page.data['pagination']['has_next'])
+        self.assertEqual(len(last_page.data['watch_history']), 1)
+        self.assertFalse(last_page.data['pagination']['has_next'])
+
+    def test_watch_history_rejects_bad_paging(self):
+        """
+        Test that non-integer paging parameters are a client error, not a 500.
+        """
+        for params in ({'page': 'abc'}, {'page_size': '2.5'}):
+            response = self.client.get('/api/watch-history/', params)
+            self.assertEqual(response.status_code, 400)
+
+    @patch('api.signals.CommentAnalysisService')
+    @patch('api.views.ANALYSIS_EXECUTOR')
+    def test_add_comment_updates_comment_count(self, mock_executor, MockService):
+        """
+        Test that adding a comment refreshes comment_count on commit.
+        """
+        MockService.return_value.analyze_many.return_value = {}
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                f'/api/shorts/{self.short.id}/comment/', {'content': 'Nice!'}, format='json'
+            )
+
+        self.assertEqual(response.status_code, 201)
+        self.short.refresh_from_db()
+        self.assertEqual(self.short.comment_count, 1)
+
+    @patch('api.views._cached_analyze_video_audio')
+    @patch('api.views.gemini_audio_service')
+    def test_process_all_streams_results_and_summary(self, mock_service, mock_analyze):
+        """
+        Test that batch processing streams valid JSON with per-file results and a summary.
+        """
+        import json
+        import shutil
+        import tempfile
+        from django.contrib.auth.models import User
+        from rest_framework.test import APIClient
+
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        os.makedirs(os.path.join(media_root, 'videos'))
+        for name in ('a.mp4', 'b.mp4'):
+            open(os.path.join(media_root, 'videos', name), 'wb').close()
+
+        mock_service.is_available.return_value = True
+        mock_analyze.side_effect = lambda path, force=False: (
+            {'transcript': 'hi', 'audio_quality_score': 80.0, 'language': 'en'}
+            if path.endswith('a.mp4') else {'error': 'quota'}
+        )
+        client = APIClient()
+        client.force_authenticate(user=User.objects.create_user(username='ops', password='pass'))
+
+        with self.settings(MEDIA_ROOT=media_root):
+            response = client.post('/api/audio/process-all/')
+            body = json.loads(b''.join(response.streaming_content))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(body['results']), 2)
+        self.assertEqual(body['summary'], {
+            'total_videos': 2, 'successful_processes': 1, 'average_quality_score': 80.0
+        })
+        self.assertEqual(body['message'], 'Processed 1/2 videos successfully')
+
+    @patch('api.views._analyze_video_files')
+    @patch('api.views.gemini_audio_service')
+    def test_process_all_closes_body_when_batch_fails(self, mock_service, mock_files):
+        """
+        Test that missing results and mid-stream failures still produce valid JSON.
+        """
+        import json
+        import shutil
+        import tempfile
+        from pathlib import Path
+        from django.contrib.auth.models import User
+        from rest_framework.test import APIClient
+
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        os.makedirs(os.path.join(media_root, 'videos'))
+        open(os.path.join(media_root, 'videos', 'a.mp4'), 'wb').close()
+
+        def results(video_files, force=False):
+            yield Path('a.mp4'), None, None
+            raise RuntimeError('worker pool died')
+
+        mock_service.is_available.return_value = True
+        mock_files.side_effect = results
+        client = APIClient()
+        client.force_authenticate(user=User.objects.create_user(username='ops', password='pass'))
+
+        with self.settings(MEDIA_ROOT=media_root), self.assertLogs('api.views', level='ERROR'):
+            response = client.post('/api/audio/process-all/')
+            body = json.loads(b''.join(response.streaming_content))
+
+        self.assertEqual(body['results'], [{'filename': 'a.mp4', 'error': 'No result returned'}])
+        self.assertEqual(body['summary']['total_videos'], 1)
+        self.assertEqual(body['error'], 'worker pool died')
+
+    @patch('api.views._cached_analyze_video_audio')
+    @patch('api.views.gemini_audio_service')
+    def test_process_single_parses_force_flag(self, mock_service, mock_analyze):
+        """
+        Test that string form values like 'false' don't force a re-analysis.
+        """
+        import shutil
+        import tempfile
+        from django.contrib.auth.models import User
+        from rest_framework.test import APIClient
+
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        os.makedirs(os.path.join(media_root, 'videos'))
+        open(os.path.join(media_root, 'videos', 'a.mp4'), 'wb').close()
+
+        mock_service.is_available.return_value = True
+        mock_analyze.return_value = {'transcript': 'hi', 'audio_quality_score': 80.0}
+        client = APIClient()
+        client.force_authenticate(user=User.objects.create_user(username='ops', password='pass'))
+
+        with self.settings(MEDIA_ROOT=media_root):
+            for value, expected in (('false', False), ('0', False), ('true', True), ('1', True)):
+                client.post('/api/audio/process-single/', {'video_filename': 'a.mp4', 'force': value})
+                self.assertIs(mock_analyze.call_args.kwargs['force'], expected, value)
+
+    @patch('api.views._cached_analyze_video_audio')
+    @patch('api.views.gemini_audio_service')
+    def test_quality_report_buckets_scores(self, mock_service, mock_analyze):
+        """
+        Test that the quality report buckets scores and averages the valid ones.
+        """
+        import shutil
+        import tempfile
+        from django.contrib.auth.models import User
+        from rest_framework.test import APIClient
+
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        os.makedirs(os.path.join(media_root, 'videos'))
+        scores = {'a.mp4': 90.0, 'b.mp4': 60.0, 'c.mp4': 10.0}
+        for name in scores:
+            open(os.path.join(media_root, 'videos', name), 'wb').close()
+
+        mock_service.is_available.return_value = True
+        mock_analyze.side_effect = lambda path, force=False: {
+            'audio_quality_score': scores[os.path.basename(path)]
+        }
+        client = APIClient()
+        client.force_authenticate(user=User.objects.create_user(username='ops', password='pass'))
+
+        with self.settings(MEDIA_ROOT=media_root):
+            report = client.get('/api/audio/quality-report/').data['report']
+
+        self.assertEqual(report['quality_distribution'], {'excellent': 1, 'good': 1, 'fair': 0, 'poor': 1})
+        self.assertAlmostEqual(report['average_quality_score'], 160.0 / 3)
+        self.assertEqual(report['processing_errors'], 0)
+
+    def test_video_listing_rescans_when_directory_changes(self):
+        """
+        Test that the cached MP4 listing picks up newly added videos.
+        """
+        import shutil
+        import tempfile
+        from .views import _list_video_files
+
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        videos_dir = os.path.join(media_root, 'videos')
+        os.makedirs(videos_dir)
+        open(os.path.join(videos_dir, 'a.mp4'), 'wb').close()
+        open(os.path.join(videos_dir, 'notes.txt'), 'wb').close()
+
+        with self.settings(MEDIA_ROOT=media_root):
+            self.assertEqual([path.name for path, _ in _list_video_files()], ['a.mp4'])
+
+            open(os.path.join(videos_dir, 'b.mp4'), 'wb').close()
+            # Force a visible mtime change on filesystems with coarse timestamps
+            os.utime(videos_dir, ns=(0, os.stat(videos_dir).st_mtime_ns + 1))
+
+            self.assertEqual(sorted(path.name for path, _ in _list_video_files()), ['a.mp4', 'b.mp4'])
+
+        with self.settings(MEDIA_ROOT=os.path.join(media_root, 'missing')):
+            self.assertEqual(_list_video_files(), ())
+
+
+class BulkPointsCalculationTests(TestCase):
+    """
+    Test the batch points calculation in the monthly revenue service.
+    """
+
+    def test_uncalculated_shorts_are_scored_in_bulk(self):
+        """
+        Test that every uncalculated short gets reward scores persisted.
+        """
+        from django.contrib.auth.models import User
+        from .models import Short
+        from .reward_service import monthly_revenue_service
+
+        user = User.objects.create_user(username='creator', password='pass')
+        first = Short.objects.create(author=user, video='videos/a.mp4', view_count=10)
+        second = Short.objects.create(author=user, video='videos/b.mp4', view_count=3, like_count=2)
+
+        result = monthly_revenue_service.calculate_points_for_uncalculated_shorts()
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['calculated_count'], 2)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(first.final_reward_score, 10)
+        self.assertEqual(second.final_reward_score, 13)
+        self.assertIsNotNone(second.reward_calculated_at)
+
+
+class CachedSerializerFieldsTests(TestCase):
+    """
+    Test the per-class field cache used by NoteSerializer.
+    """
+
+    def test_instances_get_their_own_bound_fields(self):
+        """
+        Test that each serializer binds its own copies of the cached fields and still validates.
+        """
+        from .serializers import NoteSerializer
+
+        first = NoteSerializer(data={'title': 'a' * 200, 'content': 'x'})
+        second = NoteSerializer(data={'title': 'ok', 'content': 'x'})
+
+        self.assertIsNot(first.fields['title'], second.fields['title'])
+        self.assertIs(second.fields['title'].parent, second)
+        self.assertFalse(first.is_valid())
+        self.assertIn('title', first.errors)
+        self.assertTrue(second.is_valid(), second.errors)
+
+
+class CommentSentimentCacheTests(TestCase):
+    """
+    Test the in-process sentiment cache for repeated comment texts.
+    """
+
+    def setUp(self):
+        from .comment_analysis_service import COMMENT_SENTIMENT_CACHE, CommentAnalysisService
+
+        COMMENT_SENTIMENT_CACHE.clear()
+        self.addCleanup(COMMENT_SENTIMENT_CACHE.clear)
+
+        with patch.object(CommentAnalysisService, '_load_pipeline'):
+            self.service = CommentAnalysisService()
+        self.service.pipeline = MagicMock(return_value=[[
+            {'label': 'LABEL_0', 'score': 0.1},
+            {'label': 'LABEL_1', 'score': 0.2},
+            {'label': 'LABEL_2', 'score': 0.7},
+        ]])
+        self.service.pipeline.model = None
+
+    def test_duplicate_comments_skip_the_model(self):
+        """
+        Test that comments differing only in case and whitespace reuse one result.
+        """
+        first = self.service.analyze_comment('First!')
+        second = self.service.analyze_comment('  first!  ')
+
+        self.assertEqual(self.service.pipeline.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertEqual(first['sentiment_label'], 'positive')
+
+    @patch('api.comment_analysis_service.pipeline')
+    def test_services_share_loaded_model(self, mock_pipeline):
+        """
+        Test that the transformer pipeline is loaded once per model, not per service.
+        """
+        from .comment_analysis_service import CommentAnalysisService
+
+        mock_pipeline.return_value.model = None
+        self.addCleanup(CommentAnalysisService._pipelines.pop, 'test/model', None)
+
+        first = CommentAnalysisService(model_name='test/model')
+        second = CommentAnalysisService(model_name='test/model')
+
+        mock_pipeline.assert_called_once()
+        self.assertIs(first.pipeline, second.pipeline)
+        self.assertTrue(second.is_available)
+
+    def test_cache_keys_include_model(self):
+        """
+        Test that results from different models are cached separately.
+        """
+        from .comment_analysis_service import SentimentResultCache
+
+        self.assertNotEqual(SentimentResultCache.key('nice', 'model-a'), SentimentResultCache.key('nice', 'model-b'))
+
+    def test_cache_evicts_least_recently_used(self):
+        """
+        Test that the cache keeps at most maxsize entries.
+        """
+        from .comment_analysis_service import SentimentResultCache
+
+        cache = SentimentResultCache(maxsize=2)
+        cache.set(b'a', {'n': 1})
+        cache.set(b'b', {'n': 2})
+        cache.get(b'a')
+        cache.set(b'c', {'n': 3})
+
+        self.assertIsNotNone(cache.get(b'a'))
+        self.assertIsNone(cache.get(b'b'))
+        self.assertIsNotNone(cache.get(b'c'))
+
+
+class WalletIntegrityReportTests(TestCase):
+    """
+    Test the wallet integrity report over a chain of reward transactions.
+    """
+
+    def setUp(self):
+        """Create a wallet with a short chain of confirmed transactions."""
+        from django.contrib.auth.models import User
+        from rest_framework.test import APIClient
+        from .views import create_reward_transaction
+
+        self.user = User.objects.create_user(username='earner', password='pass')
+        # Amounts carry the field's four decimal places so the stored hash round-trips
+        for amount in ('1.0000', '2.0000', '3.0000'):
+            create_reward_transaction(self.user, 'bonus', amount, f'Bonus {amount}')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_report_counts_verified_and_chained_transactions(self):
+        """
+        Test that an untouched chain reports every transaction as valid without per-row queries.
+        """
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/wallet/integrity/')
+
+        self.assertEqual(response.data['total_transactions'], 3)
+        self.assertEqual(response.data['verified_transactions'], 3)
+        self.assertEqual(response.data['chain_valid_transactions'], 3)
+        self.assertEqual(response.data['confirmed_transactions'], 3)
+
+    def test_wallet_balance_matches_transactions(self):
+        """
+        Test that each reward transaction is credited to the wallet exactly once.
+        """
+        from decimal import Decimal
+        from .models import Wallet
+
+        wallet = Wallet.objects.get(user=self.user)
+        self.assertEqual(wallet.balance, Decimal('6'))
+        self.assertEqual(wallet.total_earnings, Decimal('6'))
+
+    def test_deleting_transaction_rebalances_wallet(self):
+        """
+        Test that removing a transaction takes its amount back out of the wallet.
+        """
+        from decimal import Decimal
+        from .models import Transaction, Wallet
+
+        Transaction.objects.filter(wallet__user=self.user, amount=Decimal('3')).get().delete()
+
+        wallet = Wallet.objects.get(user=self.user)
+        self.assertEqual(wallet.balance, Decimal('3'))
+        self.assertEqual(wallet.total_earnings, Decimal('3'))
+
+    def test_verify_transaction_checks_hash_and_chain(self):
+        """
+        Test that verifying one transaction needs only its row and its predecessor.
+        """
+        from .models import Transaction
+
+        latest = Transaction.objects.filter(wallet__user=self.user).order_by('-created_at').first()
+
+        with self.assertNumQueries(2):
+            response = self.client.get(f'/api/wallet/verify/{latest.id}/')
+
+        self.assertTrue(response.data['integrity_verified'])
+        self.assertTrue(response.data['chain_valid'])
+
+    def test_verify_unknown_transaction_returns_404(self):
+        """
+        Test that a transaction outside the user's wallet is reported as not found.
+        """
+        import uuid
+
+        response = self.client.get(f'/api/wallet/verify/{uuid.uuid4()}/')
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_report_detects_tampered_amount(self):
+        """
+        Test that editing a stored amount fails its own check and breaks its successor's chain.
+        """
+        from .models import Transaction
+
+        oldest = Transaction.objects.filter(wallet__user=self.user).order_by('created_at').first()
+        Transaction.objects.filter(id=oldest.id).update(amount='100.0000')
+
+        response = self.client.get('/api/wallet/integrity/')
+
+        self.assertEqual(response.data['verified_transactions'], 2)
+        self.assertEqual(response.data['chain_valid_transactions'], 2)
+
+
+class AnalyzeSingleVideoTests(TestCase):
+    """
+    Test the manual single-video Gemini analysis endpoint.
+    """
+
+    def setUp(self):
+        """Create a short owned by an authenticated API client."""
+        from django.contrib.auth.models import User
+        from rest_framework.test import APIClient
+        from .models import Short
+
+        self.user = User.objects.create_user(username='analyst', password='pass')
+        self.short = Short.objects.create(author=self.user, video='videos/test.mp4')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    @patch('api.views.gemini_video_service')
+    def test_rejects_short_already_processing(self, mock_service):
+        """
+        Test that a short whose analysis is in flight is not analyzed again.
+        """
+        from .models import Short
+
+        mock_service.is_available.return_value = True
+        Short.objects.filter(pk=self.short.pk).update(video_analysis_status='processing')
+
+        response = self.client.post('/api/video/analyze/', {'short_id': str(self.short.id)}, format='json')
+
+        self.assertEqual(response.status_code, 409)
+        mock_service.analyze_video.assert_not_called()
+
+    @patch('api.views.gemini_video_service')
+    def test_failed_analysis_releases_claim(self, mock_service):
+        """
+        Test that a failed run records the error and leaves the short claimable.
+        """
+        mock_service.is_available.return_value = True
+        mock_service.analyze_video.return_value = {'success': False, 'error': 'quota exceeded'}
+
+        response = self.client.post('/api/video/analyze/', {'short_id': str(self.short.id)}, format='json')
+
+        self.assertEqual(response.status_code, 500)
+        self.short.refresh_from_db()
+        self.assertEqual(self.short.video_analysis_status, 'failed')
+        self.assertEqual(self.short.video_analysis_error, 'quota exceeded')
+
+
+class BatchAnalyzeCommentsTests(TestCase):
+    """
+    Test the batch comment analysis endpoint and its background job.
+    """
+
+    def setUp(self):
+        """Create a short and an authenticated API client."""
+        from django.contrib.auth.models import User
+        from rest_framework.test import APIClient
+        from .models import Short
+
+        self.user = User.objects.create_user(username='moderator', password='pass')
+        self.short = Short.objects.create(author=self.user, video='videos/test.mp4')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    @patch('api.views.BATCH_ANALYSIS_EXECUTOR')
+    def test_batch_is_queued_off_the_request(self, mock_executor):
+        """
+        Test that the endpoint hands the batch to the analysis pool and returns 202.
+        """
+        from .views import _batch_analyze_comments
+
+        response = self.client.post(
+            '/api/batch-analyze-comments/',
+            {'short_ids': [str(self.short.id)], 'update_aggregates': False},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, 202)
+        mock_executor.submit.assert_called_once_with(_batch_analyze_comments, [str(self.short.id)], False)
+
+    @patch('api.views.CommentAnalysisService')
+    def test_background_job_analyzes_each_existing_short(self, MockService):
+        """
+        Test that the job fetches shorts and their pending comments up front and skips unknown or invalid ids.
+        """
+        import uuid
+        from .views import _batch_analyze_comments
+
+        from .models import Comment
+
+        pending = Comment.objects.create(short=self.short, user=self.user, content='great')
+        Comment.objects.create(short=self.short, user=self.user, content='done', sentiment_score=0.5)
+        MockService.return_value.analyze_comments_for_short.return_value = {'comments_analyzed': 1, 'errors': 0}
+
+        with self.assertNumQueries(2):
+            _batch_analyze_comments([str(self.short.id), str(uuid.uuid4()), 'not-a-uuid'])
+
+        MockService.return_value.analyze_comments_for_short.assert_called_once()
+        analyzed_short = MockService.return_value.analyze_comments_for_short.call_args[0][0]
+        self.assertEqual(analyzed_short.id, self.short.id)
+        self.assertEqual(analyzed_short.pending_comments, [pending])
+
+
+class RecalculateShortRewardsTests(TestCase):
+    """
+    Test the admin endpoint that recalculates a short's rewards.
+    """
+
+    def setUp(self):
+        """Create a short with views and an admin API client."""
+        from django.contrib.auth.models import User
+        from rest_framework.test import APIClient
+        from .models import Short, View
+
+        self.admin = User.objects.create_superuser(username='admin', password='pass')
+        self.short = Short.objects.create(author=self.admin, video='videos/test.mp4', view_count=2)
+        View.objects.create(short=self.short, session_id='a', ip_address='127.0.0.1', watch_percentage=40)
+        View.objects.create(short=self.short, session_id='b', ip_address='127.0.0.1', watch_percentage=80)
+        Short.objects.filter(pk=self.short.pk).update(average_watch_percentage=0)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def test_recalculation_reports_new_average(self):
+        """
+        Test that recalculation refreshes average_watch_percentage from the views.
+        """
+        response = self.client.post(f'/api/admin/shorts/{self.short.id}/recalculate-rewards/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['changes']['average_watch_percentage']['before'], 0)
+        self.assertEqual(response.data['changes']['average_watch_percentage']['after'], 60)
+
+    def test_missing_short_returns_404(self):
+        """
+        Test that an unknown short id is reported as not found.
+        """
+        import uuid
+
+        response = self.client.post(f'/api/admin/shorts/{uuid.uuid4()}/recalculate-rewards/')
+
+        self.assertEqual(response.status_code, 404)
+
+
+class UserShortsListingTests(TestCase):
+    """
+    Test the creator listings that render full ShortSerializer output.
+    """
+
+    def setUp(self):
+        """Create two shorts with comments, replies and a like."""
+        from django.contrib.auth.models import User
+        from rest_framework.test import APIClient
+        from .models import Short, Comment, Like
+
+        self.creator = User.objects.create_user(username='creator', password='pass')
+        self.fan = User.objects.create_user(username='fan', password='pass')
+        first = Short.objects.create(author=self.creator, video='videos/a.mp4', view_count=5)
+        second = Short.objects.create(author=self.creator, video='videos/b.mp4', view_count=7)
+        Short.objects.filter(pk=first.pk).update(like_count=3)
+        Short.objects.create(author=self.fan, video='videos/c.mp4', view_count=2)
+        for short in (first, second):
+            comment = Comment.objects.create(short=short, user=self.fan, content='nice')
+            Comment.objects.create(short=short, user=self.creator, content='thanks', parent=comment)
+        Like.objects.create(short=first, user=self.creator)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.creator)
+
+    def test_my_shorts_renders_nested_data_in_constant_queries(self):
+        """
+        Test that authors, commenters, reply counts and is_liked come from prefetched data.
+        """
+        with self.assertNumQueries(4):
+            response = self.client.get('/api/my-shorts/')
+
+        shorts = {short['video'].rsplit('/', 1)[-1]: short for short in response.data}
+        first = shorts['a.mp4']
+        self.assertEqual(first['author']['shorts_count'], 2)
+        self.assertEqual(first['author']['total_views'], 12)
+        self.assertTrue(first['is_liked'])
+        self.assertFalse(shorts['b.mp4']['is_liked'])
+
+        top_level = next(comment for comment in first['comments'] if comment['parent'] is None)
+        self.assertEqual(top_level['reply_count'], 1)
+        self.assertEqual(top_level['user']['username'], 'fan')
+        self.assertEqual(top_level['user']['total_views'], 2)
+
+    def test_profile_reports_user_totals(self):
+        """
+        Test that the profile header totals match the user's active shorts.
+        """
+        response = self.client.get('/api/profile/creator/')
+
+        self.assertEqual(response.data['user']['shorts_count'], 2)
+        self.assertEqual(response.data['user']['total_views'], 12)
+        self.assertEqual(len(response.data['shorts']), 2)
+
+
+class BatchAnalyzeVideosTests(TestCase):
+    """
+    Test the batch Gemini video analysis endpoint and its background job.
+    """
+
+    def setUp(self):
+        """Create pending and completed shorts for an authenticated API client."""
+        from django.contrib.auth.models import User
+        from rest_framework.test import APIClient
+        from .models import Short
+
+        self.user = User.objects.create_user(username='uploader', password='pass')
+        self.pending = Short.objects.create(author=self.user, video='videos/a.mp4')
+        self.failed = Short.objects.create(author=self.user, video='videos/b.mp4', video_analysis_status='failed')
+        Short.objects.create(author=self.user, video='videos/c.mp4', video_analysis_status='completed')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    @patch('api.views.BATCH_ANALYSIS_EXECUTOR')
+    @patch('api.views.gemini_video_service')
+    def test_batch_is_claimed_and_queued(self, mock_service, mock_executor):
+        """
+        Test that unanalyzed videos are marked processing and handed to the analysis pool.
+        """
+        from .views import _analyze_videos_in_background
+
+        mock_service.is_available.return_value = True
+
+        response = self.client.post('/api/video/batch-analyze/')
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data['queued_count'], 2)
+        self.pending.refresh_from_db()
+        self.assertEqual(self.pending.video_analysis_status, 'processing')
+        job, short_ids = mock_executor.submit.call_args[0]
+        self.assertIs(job, _analyze_videos_in_background)
+        self.assertCountEqual(short_ids, [self.pending.id, self.failed.id])
+
+    @patch('api.views.gemini_video_service')
+    def test_background_job_records_results(self, mock_service):
+        """
+        Test that the job stores successful results and failures per short.
+        """
+        from .views import _analyze_videos_in_background
+
+        def analyze(video_path):
+            if video_path.endswith('a.mp4'):
+                return {'success': True, 'quality_score': 80, 'summary': 'Nice'}
+            return {'success': False, 'error': 'quota exceeded'}
+
+        mock_service.analyze_video.side_effect = analyze
+
+        _analyze_videos_in_background([self.pending.id, self.failed.id])
+
+        self.pending.refresh_from_db()
+        self.failed.refresh_from_db()
+        self.assertEqual(self.pending.video_analysis_status, 'completed')
+        self.assertEqual(self.pending.video_quality_score, 80)
+        self.assertEqual(self.failed.video_analysis_status, 'failed')
+        self.assertEqual(self.failed.video_analysis_error, 'quota exceeded')
+
+    @patch('api.views.gemini_video_service')
+    def test_unsaved_results_release_claims(self, mock_service):
+        """
+        Test that claimed shorts are marked failed when the results can't be written.
+        """
+        from .models import Short
+        from .views import _analyze_videos_in_background
+
+        Short.objects.filter(id=self.pending.id).update(video_analysis_status='processing')
+        mock_service.analyze_video.return_value = {'success': True, 'quality_score': 55}
+
+        with patch.object(Short.objects, 'bulk_update', side_effect=RuntimeError('db down')), \
+                self.assertLogs('api.views', level='ERROR'):
+            _analyze_videos_in_background([self.pending.id])
+
+        self.pending.refresh_from_db()
+        self.assertEqual(self.pending.video_analysis_status, 'failed')
+        self.assertIn('stopped', self.pending.video_analysis_error)
+
+    @patch('api.views.BATCH_ANALYSIS_EXECUTOR')
+    @patch('api.views.gemini_video_service')
+    def test_failed_submit_releases_claims(self, mock_service, mock_executor):
+        """
+        Test that videos are not left processing when the job can't be queued.
+        """
+        mock_service.is_available.return_value = True
+        mock_executor.submit.side_effect = RuntimeError('cannot schedule new futures after shutdown')
+
+        response = self.client.post('/api/video/batch-analyze/')
+
+        self.assertEqual(response.status_code, 500)
+        self.pending.refresh_from_db()
+        self.assertEqual(self.pending.video_analysis_status, 'failed')
+
+    @patch('api.views.BATCH_ANALYSIS_EXECUTOR')
+    def test_only_unclaimed_videos_are_queued(self, mock_executor):
+        """
+        Test that videos another request already claimed are not queued a second time.
+        """
+        from .models import Short
+        from .views import _analyze_videos_in_background, _queue_video_analysis
+
+        Short.objects.filter(id=self.failed.id).update(video_analysis_status='processing')
+
+        claimed_ids = _queue_video_analysis([self.pending.id, self.failed.id])
+
+        self.assertEqual(claimed_ids, [self.pending.id])
+        mock_executor.submit.assert_called_once_with(_analyze_videos_in_background, [self.pending.id])
+
+    def test_cancelled_job_releases_claims(self):
+        """
+        Test that a job cancelled before it runs hands its videos back for retry.
+        """
+        from concurrent.futures import Future
+        from .models import Short
+        from .views import _queue_video_analysis
+
+        future = Future()
+        with patch('api.views.BATCH_ANALYSIS_EXECUTOR') as mock_executor:
+            mock_executor.submit.return_value = future
+            _queue_video_analysis([self.pending.id])
+
+        self.pending.refresh_from_db()
+        self.assertEqual(self.pending.video_analysis_status, 'processing')
+
+        future.cancel()
+
+        self.pending.refresh_from_db()
+        self.assertEqual(self.pending.video_analysis_status, 'failed')
+
+    @patch('api.views.gemini_video_service')
+    def test_background_job_writes_results_in_one_batch(self, mock_service):
+        """
+        Test that the job writes every analysed short back with a single UPDATE statement.
+        """
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from .views import _analyze_videos_in_background
+
+        mock_service.analyze_video.return_value = {'success': True, 'quality_score': 55}
+
+        with CaptureQueriesContext(connection) as queries:
+            _analyze_videos_in_background([self.pending.id, self.failed.id])
+
+        updates = [q['sql'] for q in queries.captured_queries if q['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.failed.refresh_from_db()
+        self.assertEqual(self.failed.video_quality_score, 55)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class VideoAnalysisReportTests(TestCase):
+    """
+    Test the per-user video analysis report.
+    """
+
+    def setUp(self):
+        """Create analysed shorts across the quality buckets."""
+        from django.contrib.auth.models import User
+        from django.core.cache import caches
+        from rest_framework.test import APIClient
+        from .models import Short
+
+        caches['reports'].clear()
+        self.user = User.objects.create_user(username='reporter', password='pass')
+        for score, categories in ((90, ['music']), (70, ['music', 'dance']), (30, [])):
+            Short.objects.create(
+                author=self.user, video='videos/r.mp4', video_analysis_status='completed',
+                video_quality_score=score, video_sentiment_score=0.5, video_content_categories=categories,
+            )
+        Short.objects.create(author=self.user, video='videos/p.mp4')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_report_summary(self):
+        """
+        Test that averages, buckets and categories cover only analysed videos.
+        """
+        with self.assertNumQueries(2):  # aggregate, rows
+            response = self.client.get('/api/video/analysis-report/')
+
+        self.assertEqual(response.status_code, 200)
+        summary = response.data['summary']
+        self.assertEqual(summary['total_analyzed_videos'], 3)
+        self.assertEqual(summary['average_quality_score'], 63.33)
+        self.assertEqual(summary['average_engagement_prediction'], 0)
+        self.assertEqual(summary['average_sentiment_score'], 0.5)
+        self.assertEqual(summary['quality_distribution'], {'excellent': 1, 'good': 1, 'fair': 0, 'poor': 1})
+        self.assertEqual(summary['top_content_categories'][0], ('music', 2))
+        self.assertEqual(len(response.data['videos']), 3)
+
+    def test_report_without_analysed_videos(self):
+        """
+        Test that a user with nothing analysed gets the empty report.
+        """
+        from django.contrib.auth.models import User
+
+        self.client.force_authenticate(user=User.objects.create_user(username='fresh', password='pass'))
+
+        response = self.client.get('/api/video/analysis-report/')
+
+        self.assertEqual(response.data['total_videos'], 0)
+
+    def test_report_is_dropped_when_a_short_is_saved_elsewhere(self):
+        """
+        Test that analysis writes outside the API views (admin, commands) refresh the report.
+        """
+        from .models import Short
+
+        self.client.get('/api/video/analysis-report/')
+
+        short = Short.objects.get(video_analysis_status='pending')
+        short.video_analysis_status = 'completed'
+        short.video_quality_score = 45
+        short.save(update_fields=['video_analysis_status', 'video_quality_score'])
+
+        response = self.client.get('/api/video/analysis-report/')
+        self.assertEqual(response.data['summary']['total_analyzed_videos'], 4)
+
+    @patch('api.views.gemini_video_service')
+    def test_report_is_cached_until_analysis_is_written(self, mock_service):
+        """
+        Test that the report is served from cache and refreshed after a batch analysis.
+        """
+        from .models import Short
+        from .views import _analyze_videos_in_background
+
+        self.client.get('/api/video/analysis-report/')
+        pending = Short.objects.get(video_analysis_status='pending')
+
+        with self.assertNumQueries(0):
+            cached = self.client.get('/api/video/analysis-report/')
+        self.assertEqual(cached.data['summary']['total_analyzed_videos'], 3)
+
+        mock_service.analyze_video.return_value = {'success': True, 'quality_score': 50}
+        _analyze_videos_in_background([pending.id])
+
+        response = self.client.get('/api/video/analysis-report/')
+        self.assertEqual(response.data['summary']['total_analyzed_videos'], 4)
+
+
+class RewardHistoryTests(TestCase):
+    """
+    Test reward history pagination.
+    """
+
+    def setUp(self):
+        """Create three rewarded shorts and one without rewards."""
+        from django.contrib.auth.models import User
+        from django.utils import timezone
+        from .models import Short
+
+        self.user = User.objects.create_user(username='earner', password='pass')
+        for _ in range(3):
+            Short.objects.create(author=self.user, video='videos/h.mp4', reward_calculated_at=timezone.now())
+        Short.objects.create(author=self.user, video='videos/h.mp4')
+
+    def get_history(self, **params):
+        """Call reward_history directly; it has no route."""
+        from rest_framework.test import APIRequestFactory, force_authenticate
+        from .views import reward_history
+
+        request = APIRequestFactory().get('/reward-history/', params)
+        force_authenticate(request, user=self.user)
+        return reward_history(request)
+
+    def test_full_page_counts_total(self):
+        """
+        Test that a page with more rows behind it reports has_next and the full total.
+        """
+        response = self.get_history(page=1, page_size=2)
+
+        self.assertEqual(len(response.data['history']), 2)
+        self.assertEqual(response.data['pagination']['total_count'], 3)
+        self.assertTrue(response.data['pagination']['has_next'])
+
+    def test_last_page_skips_count(self):
+        """
+        Test that the last page derives the total from its own rows in a single query.
+        """
+        with self.assertNumQueries(1):
+            response = self.get_history(page=2, page_size=2)
+
+        self.assertEqual(len(response.data['history']), 1)
+        self.assertEqual(response.data['pagination']['total_count'], 3)
+        self.assertFalse(response.data['pagination']['has_next'])
+
+
+class TriggerAutomaticAnalysisTests(TestCase):
+    """
+    Test the admin trigger for analysing recent uploads.
+    """
+
+    @patch('api.views.BATCH_ANALYSIS_EXECUTOR')
+    @patch('api.views.gemini_video_service')
+    def test_recent_uploads_are_queued(self, mock_service, mock_executor):
+        """
+        Test that pending recent uploads are claimed and handed to the background job.
+        """
+        from django.contrib.auth.models import User
+        from rest_framework.test import APIRequestFactory, force_authenticate
+        from .models import Short
+        from .views import _analyze_videos_in_background, trigger_automatic_analysis
+
+        mock_service.is_available.return_value = True
+        admin = User.objects.create_user(username='admin', password='pass', is_staff=True)
+        pending = Short.objects.create(author=admin, video='videos/n.mp4')
+        Short.objects.create(author=admin, video='videos/d.mp4', video_analysis_status='completed')
+
+        request = APIRequestFactory().post('/trigger-analysis/')
+        force_authenticate(request, user=admin)
+        response = trigger_automatic_analysis(request)
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data['queued_count'], 1)
+        mock_executor.submit.assert_called_once_with(_analyze_videos_in_background, [pending.id])
+        pending.refresh_from_db()
+        self.assertEqual(pending.video_analysis_status, 'processing')
+
+    @patch('api.views.BATCH_ANALYSIS_EXECUTOR')
+    @patch('api.views.gemini_video_service')
+    def test_failed_submit_releases_claims(self, mock_service, mock_executor):
+        """
+        Test that recent uploads are not left processing when the job can't be queued.
+        """
+        from django.contrib.auth.models import User
+        from rest_framework.test import APIRequestFactory, force_authenticate
+        from .models import Short
+        from .views import trigger_automatic_analysis
+
+        mock_service.is_available.return_value = True
+        mock_executor.submit.side_effect = RuntimeError('cannot schedule new futures after shutdown')
+        admin = User.objects.create_user(username='admin', password='pass', is_staff=True)
+        pending = Short.objects.create(author=admin, video='videos/n.mp4')
+
+        request = APIRequestFactory().post('/trigger-analysis/')
+        force_authenticate(request, user=admin)
+        response = trigger_automatic_analysis(request)
+
+        self.assertEqual(response.status_code, 500)
+        pending.refresh_from_db()
+        self.assertEqual(pending.video_analysis_status, 'failed')
+
+
+class AdminVideoAnalysisActionTests(TestCase):
+    """
+    Test the Short admin action that analyses selected videos.
+    """
+
+    @patch('api.gemini_video_service.gemini_video_service')
+    def test_interrupted_action_releases_claims(self, mock_service):
+        """
+        Test that shorts the loop never finished don't stay stuck in processing.
+        """
+        from django.contrib import admin as django_admin
+        from django.contrib.auth.models import User
+        from django.test import RequestFactory
+        from .admin import ShortAdmin
+        from .models import Short
+
+        mock_service.is_available.return_value = True
+        mock_service.analyze_video.side_effect = KeyboardInterrupt
+        author = User.objects.create_user(username='creator', password='pass')
+        short = Short.objects.create(author=author, video='videos/a.mp4')
+
+        model_admin = ShortAdmin(Short, django_admin.site)
+        with self.assertRaises(KeyboardInterrupt):
+            model_admin.analyze_videos_for_selected(RequestFactory().post('/'), Short.objects.all())
+
+        short.refresh_from_db()
+        self.assertEqual(short.video_analysis_status, 'failed')
+
+
+class ShortOwnershipCheckTests(TestCase):
+    """
+    Test the ownership checks on per-short reward endpoints.
+    """
+
+    def test_non_owner_is_denied_without_loading_author(self):
+        """
+        Test that a non-owner gets 403 after the single short lookup.
+        """
+        from django.contrib.auth.models import User
+        from rest_framework.test import APIRequestFactory, force_authenticate
+        from .models import Short
+        from .views import process_short_payout
+
+        owner = User.objects.create_user(username='owner', password='pass')
+        other = User.objects.create_user(username='other', password='pass')
+        short = Short.objects.create(author=owner, video='videos/o.mp4')
+
+        request = APIRequestFactory().post('/payout/')
+        force_authenticate(request, user=other)
+        with self.assertNumQueries(1):
+            response = process_short_payout(request, short_id=short.id)
+
+        self.assertEqual(response.status_code, 403)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class MyMonthlyEarningsTests(TestCase):
+    """
+    Test the current creator's monthly earnings view.
+    """
+
+    def setUp(self):
+        """Create scored shorts for two creators this month."""
+        from django.contrib.auth.models import User
+        from django.core.cache import caches
+        from rest_framework.test import APIClient
+        from .models import Short
+
+        caches['reports'].clear()
+        self.user = User.objects.create_user(username='creator', password='pass')
+        other = User.objects.create_user(username='rival', password='pass')
+        Short.objects.create(author=self.user, video='videos/m.mp4', final_reward_score=30.0)
+        Short.objects.create(author=other, video='videos/m.mp4', final_reward_score=70.0)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_share_of_monthly_points(self):
+        """
+        Test that the creator's points are reported against the all-creator total.
+        """
+        response = self.client.get('/api/revenue-share/my-earnings/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['user_points'], 30.0)
+        self.assertEqual(response.data['shorts_count'], 1)
+        self.assertEqual(response.data['total_points_all_creators'], 100.0)
+        self.assertEqual(response.data['user_percentage'], 30.0)
+
+    def test_caller_points_are_always_fresh(self):
+        """
+        Test that the caller's recalculated points count in the total without invalidating the cache.
+        """
+        from .models import Short
+
+        self.client.get('/api/revenue-share/my-earnings/')
+
+        short = Short.objects.get(author=self.user)
+        short.final_reward_score = 130.0
+        short.save(update_fields=['final_reward_score'])
+
+        response = self.client.get('/api/revenue-share/my-earnings/')
+
+        self.assertEqual(response.data['total_points_all_creators'], 200.0)
+        self.assertEqual(response.data['user_percentage'], 65.0)
+
+    def test_engagement_save_keeps_cached_totals(self):
+        """
+        Test that rescoring another creator's short on engagement doesn't drop the cached totals.
+        """
+        from django.core.cache import caches
+        from django.utils import timezone
+        from .models import Short
+        from .signals import monthly_points_total_cache_key
+
+        self.client.get('/api/revenue-share/my-earnings/')
+
+        rival_short = Short.objects.get(author__username='rival')
+        rival_short.like_count += 1
+        rival_short.save()
+
+        now = timezone.localtime()
+        self.assertIsNotNone(caches['reports'].get(monthly_points_total_cache_key(now.year, now.month)))
+
+    def test_deactivation_drops_cached_totals(self):
+        """
+        Test that deactivating a short removes its points from the next total.
+        """
+        from .models import Short
+
+        self.client.get('/api/revenue-share/my-earnings/')
+
+        rival_short = Short.objects.get(author__username='rival')
+        rival_short.is_active = False
+        rival_short.save(update_fields=['is_active'])
+
+        response = self.client.get('/api/revenue-share/my-earnings/')
+
+        self.assertEqual(response.data['total_points_all_creators'], 30.0)
+
+    def test_bulk_calculation_drops_cached_totals(self):
+        """
+        Test that bulk-scored shorts, which skip post_save, still refresh the total.
+        """
+        from .models import Short
+        from .reward_service import monthly_revenue_service
+
+        self.client.get('/api/revenue-share/my-earnings/')
+
+        rival = Short.objects.get(author__username='rival').author
+        Short.objects.create(author=rival, video='videos/n.mp4', view_count=100)
+        monthly_revenue_service.calculate_points_for_uncalculated_shorts()
+
+        response = self.client.get('/api/revenue-share/my-earnings/')
+
+        self.assertEqual(response.data['total_points_all_creators'], 200.0)
+
+    @patch('api.views.monthly_revenue_service.get_monthly_creator_points', return_value={})
+    def test_total_is_cached_across_callers(self, mock_points):
+        """
+        Test that the all-creator total is computed once and reused.
+        """
+        self.client.get('/api/revenue-share/my-earnings/')
+        self.client.get('/api/revenue-share/my-earnings/')
+
+        all_creator_calls = [c for c in mock_points.call_args_list if 'creator' not in c.kwargs]
+        self.assertEqual(len(all_creator_calls), 1)
+
+
+class DatabaseThreadPoolExecutorTests(TestCase):
+    """
+    Test the ORM-aware background thread pool.
+    """
+
+    @patch('api.views.close_old_connections')
+    def test_job_releases_connections_around_run(self, mock_close):
+        """
+        Test that stale connections are released before and after each job, even when it fails.
+        """
+        from .views import DatabaseThreadPoolExecutor
+
+        def failing_job():
+            raise ValueError('boom')
+
+        with DatabaseThreadPoolExecutor(max_workers=1) as executor:
+            self.assertEqual(executor.submit(lambda x: x * 2, 21).result(), 42)
+            with self.assertLogs('api.views', level='ERROR'):
+                future = executor.submit(failing_job)
+                self.assertIsInstance(future.exception(), ValueError)
+
+        self.assertEqual(mock_close.call_count, 4)
@@ -1,20 +1,27 @@
 from django.shortcuts import render, get_object_or_404
 from django.contrib.auth.models import User
-from django.db.models import F
+from django.db.models import F, Avg, Count, Sum, Q, Exists, OuterRef, Prefetch
+from django.db.models.functions import Coalesce
 from decimal import Decimal
-from .signals import analysis_completed
 from datetime import datetime
 from django.utils import timezone
 from pathlib import Path
 from django.conf import settings
+from django.core.cache import caches
+from django.db import close_old_connections, transaction
 from rest_framework import generics, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny, IsAdminUser
 from rest_framework.parsers import MultiPartParser, FormParser
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 import json
+import atexit
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from collections import Counter
+from itertools import chain
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from .serializers import (
@@ -27,12 +34,262 @@ from .reward_service import monthly_revenue_service
 from .models import Note, Short, Like, Comment, View, Wallet, Transaction, AuditLog
 from .gemini_video_service import gemini_video_service
 from .gemini_audio_service import gemini_audio_service
+from .signals import (
+    defer_reward_calculation, invalidate_video_analysis_reports, monthly_points_total_cache_key,
+    video_analysis_report_cache_key,
+)
+import hashlib
 import logging
+import uuid
 import os
 import time
 
 logger = logging.getLogger(__name__)
 
+class DatabaseThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    Thread pool for ORM jobs. Worker threads outlive requests, so each job
+    releases stale DB connections before and after it runs, the way Django
+    does around a request, and logs its own failure instead of leaving it
+    in a Future nobody reads.
+    """
+
+    def submit(self, fn, /, *args, **kwargs):
+        return super().submit(self._run_job, fn, *args, **kwargs)
+
+    @staticmethod
+    def _run_job(fn, *args, **kwargs):
+        close_old_connections()
+        try:
+            return fn(*args, **kwargs)
+        except Exception:
+            logger.exception("Background job %s failed", getattr(fn, '__name__', fn))
+            raise
+        finally:
+            close_old_connections()
+
+
+# Shared worker pool for background AI analysis so bursts of uploads/comments
+# queue up instead of spawning one thread each
+ANALYSIS_EXECUTOR = DatabaseThreadPoolExecutor(
+    max_workers=(os.cpu_count() or 1) * 2,
+    thread_name_prefix='analysis',
+)
+atexit.register(ANALYSIS_EXECUTOR.shutdown, wait=False, cancel_futures=True)
+
+# Multi-minute, rate-limited batch jobs get their own small pool so they
+# can't occupy every worker and hold up per-upload and per-comment analysis
+BATCH_ANALYSIS_EXECUTOR = DatabaseThreadPoolExecutor(
+    max_workers=settings.BATCH_ANALYSIS_WORKERS,
+    thread_name_prefix='batch-analysis',
+)
+atexit.register(BATCH_ANALYSIS_EXECUTOR.shutdown, wait=False, cancel_futures=True)
+
+
+def _parse_flag(value):
+    """Read a boolean request flag; form and query values arrive as strings such as 'false' or '0'"""
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes', 'on')
+    return bool(value)
+
+
+def _cached_analyze_video_audio(video_path, force=False):
+    """
+    Run Gemini audio analysis for a video file, reusing the stored result while
+    the file (path, mtime, size) and model are unchanged. Pass force=True to
+    re-run the analysis and overwrite the cached result.
+    """
+    stat = os.stat(video_path)
+    key_source = f"{video_path}|{stat.st_mtime}|{stat.st_size}|{gemini_audio_service.model_name}"
+    cache_key = 'gemini_audio:' + hashlib.sha256(key_source.encode()).hexdigest()
+
+    if not force:
+        cached = caches['gemini'].get(cache_key)
+        if cached is not None:
+            return cached
+
+    result = gemini_audio_service.analyze_video_audio(video_path)
+    # Only keep real analyses, not errors or fallback scores
+    if result and 'error' not in result and result.get('success', True):
+        caches['gemini'].set(cache_key, result, timeout=None)
+    return result
+
+
+@lru_cache(maxsize=4)
+def _videos_dir(media_root):
+    """Build the uploaded-videos directory once per MEDIA_ROOT"""
+    return Path(media_root) / 'videos'
+
+
+def _media_videos_path():
+    """Directory holding uploaded videos; follows MEDIA_ROOT overrides in tests"""
+    return _videos_dir(settings.MEDIA_ROOT)
+
+
+@lru_cache(maxsize=4)
+def _scan_mp4_files(directory, directory_mtime_ns):
+    """
+    Return (path, stat) pairs for the MP4 files in directory. The directory's
+    mtime is part of the cache key, so adding or removing a video rescans.
+    """
+    with os.scandir(directory) as entries:
+        return tuple(
+            (Path(entry.path), entry.stat())
+            for entry in entries
+            if entry.name.endswith('.mp4') and not entry.name.startswith('.') and entry.is_file()
+        )
+
+
+def _list_video_files():
+    """Return (path, stat) pairs for the uploaded MP4s in MEDIA_ROOT/videos"""
+    directory = _media_videos_path()
+    try:
+        directory_mtime_ns = os.stat(directory).st_mtime_ns
+    except FileNotFoundError:
+        return ()
+    return _scan_mp4_files(directory, directory_mtime_ns)
+
+
+def _apply_video_analysis_result(short, analysis_result):
+    """
+    Copy a successful Gemini video analysis onto short and return the
+    update_fields that need saving.
+    """
+    quality_score = analysis_result.get('quality_score', 50)  # quality includes focus/clarity and technical
+    content_engagement = analysis_result.get('content_engagement', 50)
+
+    # Prefer the detailed summary when the model provided one
+    short.video_analysis_summary = analysis_result.get('detailed_summary') or analysis_result.get('summary', '')
+    short.video_analysis_status = 'completed'
+    short.video_analysis_processed_at = timezone.now()
+    short.video_analysis_error = None
+
+    # Enhanced analysis fields - updated for balanced scoring
+    short.video_content_engagement = content_engagement
+    short.video_demographic_appeal = analysis_result.get('audience_appeal', 50)  # audience_appeal maps to demographic_appeal
+    short.video_content_focus = quality_score
+    short.video_content_sensitivity = analysis_result.get('content_sensitivity', 5)
+    short.video_originality = analysis_result.get('originality', 50)
+    short.video_technical_quality = quality_score
+    short.video_viral_potential = analysis_result.get('viral_potential', 50)
+    short.video_overall_score = analysis_result.get('overall_score', 50)
+
+    # Maintain legacy fields for backward compatibility
+    short.video_quality_score = quality_score
+    short.video_engagement_prediction = content_engagement
+    short.video_sentiment_score = analysis_result.get('sentiment_score', 0)  # Not part of new system
+    short.video_content_categories = analysis_result.get('content_categories', [])
+
+    update_fields = [
+        'video_analysis_summary', 'video_analysis_status', 'video_analysis_processed_at', 'video_analysis_error',
+        'video_content_engagement', 'video_demographic_appeal', 'video_content_focus', 'video_content_sensitivity',
+        'video_originality', 'video_technical_quality', 'video_viral_potential', 'video_overall_score',
+        'video_quality_score', 'video_engagement_prediction', 'video_sentiment_score', 'video_content_categories',
+    ]
+
+    # The simplified system no longer fills the legacy breakdown dicts; only
+    # write them when clearing data left behind by an older analysis
+    deferred_fields = short.get_deferred_fields()
+    for field in ('video_detailed_breakdown', 'video_demographic_analysis'):
+        if field in deferred_fields or getattr(short, field):
+            setattr(short, field, {})
+            update_fields.append(field)
+
+    return update_fields
+
+
+# Gemini calls are network-bound, so a handful of concurrent requests per batch
+MAX_PARALLEL_AUDIO_ANALYSES = 8
+
+
+def _analyze_video_files(video_files, force=False):
+    """
+    Analyze the audio of several video files concurrently.
+
+    Yields (video_file, result, error) tuples in the order of video_files as
+    soon as each is ready; error is the exception raised for that file,
+    otherwise None.
+    """
+    def analyze_one(video_file):
+        try:
+            return video_file, _cached_analyze_video_audio(str(video_file), force=force), None
+        except Exception as e:
+            return video_file, None, e
+
+    if not video_files:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_AUDIO_ANALYSES, len(video_files)))
+    try:
+        yield from executor.map(analyze_one, video_files)
+    finally:
+        # A closed generator (client disconnect) must not wait for the remaining files
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _audio_batch_entry(video_file, result, error):
+    """Build one process_all_videos_audio result entry; returns (entry, succeeded)"""
+    if error is not None:
+        return {'filename': video_file.name, 'error': str(error)}, False
+    if not result:
+        return {'filename': video_file.name, 'error': 'No result returned'}, False
+    if 'error' in result:
+        return {'filename': video_file.name, 'error': result.get('error') or 'Unknown error'}, False
+    return {
+        'filename': video_file.name,
+        'transcript': result.get('transcript', ''),
+        'audio_quality_score': result.get('audio_quality_score', 0.0),
+        'language': result.get('language', 'en')
+    }, True
+
+
+def _stream_audio_batch_results(video_files, force=False):
+    """
+    Yield the process_all_videos_audio JSON body one video at a time, so
+    transcripts are never all held in memory and the summary is computed in
+    the same pass.
+
+    This runs after the response has started, where the view's error handling
+    can't reach, so failures become entries and the body is always closed.
+    """
+    total_videos = 0
+    successful_processes = 0
+    score_sum = 0.0
+    batch_error = None
+
+    yield '{"success": true, "results": ['
+    try:
+        for video_file, result, error in _analyze_video_files(video_files, force=force):
+            try:
+                entry, succeeded = _audio_batch_entry(video_file, result, error)
+                chunk = json.dumps(entry)
+            except Exception as e:
+                logger.exception(f"Error building audio result for {video_file}")
+                entry, succeeded = {'filename': str(video_file), 'error': str(e)}, False
+                chunk = json.dumps(entry)
+            if succeeded:
+                successful_processes += 1
+                score_sum += entry['audio_quality_score']
+            yield (', ' if total_videos else '') + chunk
+            total_videos += 1
+    except Exception as e:
+        logger.exception("Batch audio processing stopped early")
+        batch_error = str(e)
+
+    average_quality = score_sum / successful_processes if successful_processes > 0 else 0
+    summary = {
+        'total_videos': total_videos,
+        'successful_processes': successful_processes,
+        'average_quality_score': round(average_quality, 2)
+    }
+    message = f'Processed {successful_processes}/{total_videos} videos successfully'
+    tail = f'], "summary": {json.dumps(summary)}, "message": {json.dumps(message)}'
+    if batch_error is not None:
+        tail += f', "error": {json.dumps(batch_error)}'
+    yield tail + '}'
+
+    logger.info(f"Batch processing completed: {successful_processes}/{total_videos} successful")
+
 
 class ShortsListView(generics.ListAPIView):
     from .serializers import ShortListSerializer
@@ -41,16 +298,22 @@ class ShortsListView(generics.ListAPIView):
     
     def get_queryset(self):
         # Use a lean queryset; avoid eager-loading comments for list view
-        return (
+        queryset = (
             Short.objects
             .filter(is_active=True)
             .select_related('author')
-            .prefetch_related('likes')
             .only(
                 'id','title','description','video','thumbnail','author','created_at',
                 'view_count','like_count','comment_count','duration','is_active'
             )
         )
+        # Resolve is_liked in the same query instead of one lookup per short
+        user = self.request.user
+        if user.is_authenticated:
+            queryset = queryset.annotate(
+                liked_by_me=Exists(Like.objects.filter(short=OuterRef('pk'), user=user))
+            )
+        return queryset
 
 
 class ShortCreateView(generics.CreateAPIView):
@@ -61,37 +324,75 @@ class ShortCreateView(generics.CreateAPIView):
     def perform_create(self, serializer):
         short = serializer.save(author=self.request.user)
         
-        # Process both audio and video analysis asynchronously
-        self.process_video_audio_async(short)
-        self.process_video_analysis_async(short)
+        # Process both audio and video analysis asynchronously, then
+        # calculate rewards once when both have finished
+        futures = [
+            self.process_video_audio_async(short),
+            self.process_video_analysis_async(short),
+        ]
+        self.calculate_rewards_when_done(short.id, futures)
     
     def process_video_audio_async(self, short):
-        """Start audio analysis in a background thread to avoid blocking the response"""
+        """Queue audio analysis on the analysis pool to avoid blocking the response"""
         def analyze_audio_in_background():
             try:
-                self.process_video_audio(short)
+                with defer_reward_calculation():
+                    self.process_video_audio(self.load_for_analysis(short.id))
             except Exception as e:
                 logger.error(f"Background audio analysis failed for {short.id}: {e}")
         
-        # Start audio analysis in background thread
-        audio_thread = threading.Thread(target=analyze_audio_in_background)
-        audio_thread.daemon = True
-        audio_thread.start()
+        future = ANALYSIS_EXECUTOR.submit(analyze_audio_in_background)
         logger.info(f"Started background audio analysis for {short.id}")
+        return future
     
     def process_video_analysis_async(self, short):
-        """Start video analysis in a background thread to avoid blocking the response"""
+        """Queue video analysis on the analysis pool to avoid blocking the response"""
         def analyze_in_background():
             try:
-                self.process_video_analysis(short)
+                with defer_reward_calculation():
+                    self.process_video_analysis(self.load_for_analysis(short.id))
             except Exception as e:
                 logger.error(f"Background video analysis failed for {short.id}: {e}")
         
-        # Start analysis in background thread
-        analysis_thread = threading.Thread(target=analyze_in_background)
-        analysis_thread.daemon = True
-        analysis_thread.start()
+        future = ANALYSIS_EXECUTOR.submit(analyze_in_background)
         logger.info(f"Started background video analysis for {short.id}")
+        return future
+    
+    def load_for_analysis(self, short_id):
+        """
+        Load a private, lean copy of the Short for one background analysis so
+        the audio and video workers never mutate the same instance
+        """
+        # Only the columns the analysis handlers read; they save via update_fields
+        return Short.objects.only(
+            'id', 'author', 'video', 'video_analysis_status',
+            'video_detailed_breakdown', 'video_demographic_analysis',
+        ).get(pk=short_id)
+    
+    def calculate_rewards_when_done(self, short_id, futures):
+        """Calculate rewards once after every analysis future has completed"""
+        # Done-callbacks instead of a blocking wait() so no pool worker sits idle
+        remaining = [len(futures)]
+        lock = threading.Lock()
+        
+        def calculate_rewards():
+            try:
+                # Reload so the full save() does not overwrite either analysis
+                Short.objects.get(pk=short_id).auto_calculate_rewards_if_ready()
+            except Exception as e:
+                logger.error(f"Reward calculation after analysis failed for {short_id}: {e}")
+        
+        def on_done(_future):
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            # The last callback can run on the request thread if its future already
+            # finished, so the ORM work goes through the pool's connection handling
+            ANALYSIS_EXECUTOR.submit(calculate_rewards)
+        
+        for future in futures:
+            future.add_done_callback(on_done)
     
     def process_video_audio(self, short):
         """Process the uploaded video to generate transcript and quality score using Gemini"""
@@ -112,15 +413,9 @@ class ShortCreateView(generics.CreateAPIView):
                 short.audio_quality_score = result.get('audio_quality_score', 0.0)
                 short.transcript_language = result.get('language', 'en')
                 short.audio_processed_at = timezone.now()
+                # Saving audio_quality_score triggers the automatic reward calculation signal
                 short.save(update_fields=['transcript', 'audio_quality_score', 'transcript_language', 'audio_processed_at'])
                 
-                # Trigger signal for automatic reward calculation
-                
-                analysis_completed.send(sender=Short, short_id=short.id, analysis_type='audio')
-                
-                # Trigger auto reward calculation after audio analysis completion
-                short.auto_calculate_rewards_if_ready()
-                
                 if result.get('success', True):
                     logger.info(f"Successfully processed audio for video {short.id}: quality_score={short.audio_quality_score}")
                 else:
@@ -141,9 +436,9 @@ class ShortCreateView(generics.CreateAPIView):
                 short.save(update_fields=['video_analysis_status', 'video_analysis_error'])
                 return
             
-            # Set status to processing
-            short.video_analysis_status = 'processing'
-            short.save(update_fields=['video_analysis_status'])
+            # Mark as processing for the admin (which skips in-flight videos) with a
+            # bare UPDATE; the single save below writes the final status
+            Short.objects.filter(pk=short.id).update(video_analysis_status='processing')
             
             # Get the video file path
             video_path = short.video.path
@@ -153,47 +448,9 @@ class ShortCreateView(generics.CreateAPIView):
             analysis_result = gemini_video_service.analyze_video(video_path)
             
             if analysis_result.get('success', False):
-                # Update the short with enhanced analysis data
-                short.video_analysis_summary = analysis_result.get('summary', '')
-                short.video_analysis_status = 'completed'
-                short.video_analysis_processed_at = timezone.now()
-                short.video_analysis_error = None
-                
-                # Enhanced analysis fields - updated for balanced scoring
-                short.video_content_engagement = analysis_result.get('content_engagement', 50)
-                short.video_demographic_appeal = analysis_result.get('audience_appeal', 50)  # audience_appeal maps to demographic_appeal
-                short.video_content_focus = analysis_result.get('quality_score', 50)  # quality includes focus/clarity
-                short.video_content_sensitivity = analysis_result.get('content_sensitivity', 5)
-                short.video_originality = analysis_result.get('originality', 50)
-                short.video_technical_quality = analysis_result.get('quality_score', 50)  # quality_score includes technical
-                short.video_viral_potential = analysis_result.get('viral_potential', 50)
-                short.video_overall_score = analysis_result.get('overall_score', 50)
-                
-                # Store detailed summary if available
-                detailed_summary = analysis_result.get('detailed_summary', '')
-                if detailed_summary:
-                    short.video_analysis_summary = detailed_summary
-                
-                # Legacy support - remove unused fields in new system
-                short.video_detailed_breakdown = {}  # Simplified system doesn't use this
-                short.video_demographic_analysis = {}  # Simplified system doesn't use this
-                
-                # Maintain legacy fields for backward compatibility
-                short.video_quality_score = analysis_result.get('quality_score', 50)  # Use new quality_score
-                short.video_engagement_prediction = analysis_result.get('content_engagement', 50)
-                short.video_sentiment_score = analysis_result.get('sentiment_score', 0)  # Not part of new system
-                short.video_content_categories = analysis_result.get('content_categories', [])
-                
-                short.save(update_fields=[
-                    'video_analysis_summary', 'video_analysis_status', 'video_analysis_processed_at', 'video_analysis_error',
-                    'video_content_engagement', 'video_demographic_appeal', 'video_content_focus', 'video_content_sensitivity',
-                    'video_originality', 'video_technical_quality', 'video_viral_potential', 'video_overall_score',
-                    'video_detailed_breakdown', 'video_demographic_analysis',
-                    'video_quality_score', 'video_engagement_prediction', 'video_sentiment_score', 'video_content_categories'
-                ])
-                
-                # Trigger auto reward calculation after video analysis completion
-                short.auto_calculate_rewards_if_ready()
+                update_fields = _apply_video_analysis_result(short, analysis_result)
+                # Saving video_overall_score triggers the automatic reward calculation signal
+                short.save(update_fields=update_fields)
                 
                 logger.info(f"Successfully analyzed video {short.id}: overall={short.video_overall_score:.1f}, engagement={short.video_content_engagement}, demographics={short.video_demographic_appeal}, originality={short.video_originality}")
             else:
@@ -237,49 +494,15 @@ def process_all_videos_audio(request):
             )
         
         # Find all video files in the media directory
-        media_videos_path = Path(settings.MEDIA_ROOT) / 'videos'
-        video_files = list(media_videos_path.glob("*.mp4"))
+        video_files = [video_path for video_path, _ in _list_video_files()]
         
-        results = []
-        for video_file in video_files:
-            try:
-                result = gemini_audio_service.analyze_video_audio(str(video_file))
-                if result and 'error' not in result:
-                    results.append({
-                        'filename': video_file.name,
-                        'transcript': result.get('transcript', ''),
-                        'audio_quality_score': result.get('audio_quality_score', 0.0),
-                        'language': result.get('language', 'en')
-                    })
-                else:
-                    results.append({
-                        'filename': video_file.name,
-                        'error': result.get('error', 'Unknown error')
-                    })
-            except Exception as e:
-                results.append({
-                    'filename': video_file.name,
-                    'error': str(e)
-                })
-        
-        # Calculate summary statistics
-        total_videos = len(results)
-        successful_processes = len([r for r in results if 'error' not in r])
-        average_quality = sum([r.get('audio_quality_score', 0) for r in results if 'error' not in r]) / successful_processes if successful_processes > 0 else 0
-        
-        response_data = {
-            'success': True,
-            'message': f'Processed {successful_processes}/{total_videos} videos successfully',
-            'summary': {
-                'total_videos': total_videos,
-                'successful_processes': successful_processes,
-                'average_quality_score': round(average_quality, 2)
-            },
-            'results': results
-        }
+        force = _parse_flag(request.data.get('force', False))
         
-        logger.info(f"Batch processing completed: {successful_processes}/{total_videos} successful")
-        return Response(response_data, status=status.HTTP_200_OK)
+        # Stream per-video results as they complete instead of buffering every transcript
+        return StreamingHttpResponse(
+            _stream_audio_batch_results(video_files, force=force),
+            content_type='application/json'
+        )
         
     except Exception as e:
         logger.error(f"Error in batch audio processing: {str(e)}")
@@ -313,8 +536,7 @@ def process_single_video_audio(request):
             }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
         
         # Construct full path to video file
-        media_videos_path = Path(settings.MEDIA_ROOT) / 'videos'
-        video_path = media_videos_path / video_filename
+        video_path = _media_videos_path() / video_filename
         
         if not video_path.exists():
             return Response({
@@ -322,7 +544,8 @@ def process_single_video_audio(request):
                 'error': f'Video file {video_filename} not found'
             }, status=status.HTTP_404_NOT_FOUND)
         
-        result = gemini_audio_service.analyze_video_audio(str(video_path))
+        force = _parse_flag(request.data.get('force', False))
+        result = _cached_analyze_video_audio(str(video_path), force=force)
         
         if 'error' in result:
             return Response({
@@ -367,36 +590,48 @@ def get_audio_quality_report(request):
             )
         
         # Find all video files and process them
-        media_videos_path = Path(settings.MEDIA_ROOT) / 'videos'
-        video_files = list(media_videos_path.glob("*.mp4"))
+        video_files = [video_path for video_path, _ in _list_video_files()]
+        
+        force = _parse_flag(request.query_params.get('force', ''))
         
         results = []
-        for video_file in video_files:
-            try:
-                result = gemini_audio_service.analyze_video_audio(str(video_file))
-                if result and 'error' not in result:
-                    results.append({
-                        'filename': video_file.name,
-                        'audio_quality_score': result.get('audio_quality_score', 0.0)
-                    })
-            except Exception as e:
+        for video_file, result, error in _analyze_video_files(video_files, force=force):
+            if error is not None:
+                results.append({
+                    'filename': video_file.name,
+                    'error': str(error)
+                })
+            elif result and 'error' not in result:
                 results.append({
                     'filename': video_file.name,
-                    'error': str(e)
+                    'audio_quality_score': result.get('audio_quality_score', 0.0)
                 })
         
-        # Generate report
-        valid_results = [r for r in results if 'error' not in r]
+        # Generate report in a single pass over the results
+        distribution = {'excellent': 0, 'good': 0, 'fair': 0, 'poor': 0}
+        processing_errors = 0
+        score_sum = 0.0
+        for r in results:
+            if 'error' in r:
+                processing_errors += 1
+                continue
+            score = r['audio_quality_score']
+            score_sum += score
+            if score >= 80:
+                distribution['excellent'] += 1
+            elif score >= 60:
+                distribution['good'] += 1
+            elif score >= 40:
+                distribution['fair'] += 1
+            else:
+                distribution['poor'] += 1
+        
+        valid_count = len(results) - processing_errors
         report = {
             'total_videos': len(results),
-            'quality_distribution': {
-                'excellent': len([r for r in valid_results if r['audio_quality_score'] >= 80]),
-                'good': len([r for r in valid_results if 60 <= r['audio_quality_score'] < 80]),
-                'fair': len([r for r in valid_results if 40 <= r['audio_quality_score'] < 60]),
-                'poor': len([r for r in valid_results if r['audio_quality_score'] < 40])
-            },
-            'average_quality_score': sum([r['audio_quality_score'] for r in valid_results]) / len(valid_results) if valid_results else 0,
-            'processing_errors': len([r for r in results if 'error' in r]),
+            'quality_distribution': distribution,
+            'average_quality_score': score_sum / valid_count if valid_count else 0,
+            'processing_errors': processing_errors,
             'detailed_results': results
         }
         
@@ -418,17 +653,14 @@ def list_videos(request):
     List all available MP4 videos in the media directory
     """
     try:
-        media_videos_path = Path(settings.MEDIA_ROOT) / 'videos'
-        videos = list(media_videos_path.glob("*.mp4"))
-        
         video_list = [
             {
                 'filename': video.name,
                 'path': str(video),
-                'size_mb': round(video.stat().st_size / (1024 * 1024), 2),
-                'modified': video.stat().st_mtime
+                'size_mb': round(video_stat.st_size / (1024 * 1024), 2),
+                'modified': video_stat.st_mtime
             }
-            for video in videos
+            for video, video_stat in _list_video_files()
         ]
         
         return Response({
@@ -455,6 +687,7 @@ def process_videos_traditional(request):
         if request.method == 'POST':
             data = json.loads(request.body)
             video_filename = data.get('video_filename')
+            force = _parse_flag(data.get('force', False))
             
             if not gemini_audio_service.is_available():
                 return JsonResponse({
@@ -464,8 +697,7 @@ def process_videos_traditional(request):
             
             if video_filename:
                 # Process single video
-                media_videos_path = Path(settings.MEDIA_ROOT) / 'videos'
-                video_path = media_videos_path / video_filename
+                video_path = _media_videos_path() / video_filename
                 
                 if not video_path.exists():
                     return JsonResponse({
@@ -473,36 +705,33 @@ def process_videos_traditional(request):
                         'error': f'Video file {video_filename} not found'
                     }, status=404)
                 
-                result = gemini_audio_service.analyze_video_audio(str(video_path))
+                result = _cached_analyze_video_audio(str(video_path), force=force)
                 return JsonResponse({
                     'success': 'error' not in result,
                     'result': result
                 })
             else:
                 # Process all videos
-                media_videos_path = Path(settings.MEDIA_ROOT) / 'videos'
-                video_files = list(media_videos_path.glob("*.mp4"))
+                video_files = [video_path for video_path, _ in _list_video_files()]
                 
                 results = []
-                for video_file in video_files:
-                    try:
-                        result = gemini_audio_service.analyze_video_audio(str(video_file))
-                        if result and 'error' not in result:
-                            results.append({
-                                'filename': video_file.name,
-                                'transcript': result.get('transcript', ''),
-                                'audio_quality_score': result.get('audio_quality_score', 0.0),
-                                'language': result.get('language', 'en')
-                            })
-                        else:
-                            results.append({
-                                'filename': video_file.name,
-                                'error': result.get('error', 'Unknown error')
-                            })
-                    except Exception as e:
+                for video_file, result, error in _analyze_video_files(video_files, force=force):
+                    if error is not None:
                         results.append({
                             'filename': video_file.name,
-                            'error': str(e)
+                            'error': str(error)
+                        })
+                    elif result and 'error' not in result:
+                        results.append({
+                            'filename': video_file.name,
+                            'transcript': result.get('transcript', ''),
+                            'audio_quality_score': result.get('audio_quality_score', 0.0),
+                            'language': result.get('language', 'en')
+                        })
+                    else:
+                        results.append({
+                            'filename': video_file.name,
+                            'error': result.get('error', 'Unknown error')
                         })
                 
                 return JsonResponse({
@@ -529,13 +758,12 @@ def toggle_like(request, short_id):
     else:
         liked = True
     
-    # Update the cached like count
-    short.like_count = short.like_count_calculated
-    short.save(update_fields=['like_count'])
+    # The Like signals adjust like_count atomically; read back the current value
+    like_count = Short.objects.filter(pk=short.pk).values_list('like_count', flat=True).first()
     
     return Response({
         'liked': liked,
-        'like_count': short.like_count
+        'like_count': like_count
     })
 
 
@@ -546,12 +774,9 @@ def add_comment(request, short_id):
     serializer = CommentSerializer(data=request.data)
     
     if serializer.is_valid():
+        # The Comment post_save signal refreshes comment_count once the request commits
         comment = serializer.save(user=request.user, short=short)
         
-        # Update the cached comment count
-        short.comment_count = short.comment_count_calculated
-        short.save(update_fields=['comment_count'])
-        
         # Automatically analyze the new comment for sentiment in background
         def analyze_comment_background():
             try:
@@ -571,10 +796,8 @@ def add_comment(request, short_id):
                 import traceback
                 logger.error(traceback.format_exc())
         
-        # Start comment analysis in background thread
-        analysis_thread = threading.Thread(target=analyze_comment_background)
-        analysis_thread.daemon = True
-        analysis_thread.start()
+        # Queue comment analysis on the shared analysis pool
+        ANALYSIS_EXECUTOR.submit(analyze_comment_background)
         
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     
@@ -585,7 +808,12 @@ def add_comment(request, short_id):
 @permission_classes([AllowAny])
 def get_comments(request, short_id):
     short = get_object_or_404(Short, id=short_id, is_active=True)
-    comments = Comment.objects.filter(short=short, is_active=True, parent=None)
+    comments = (
+        Comment.objects
+        .filter(short=short, is_active=True, parent=None)
+        .select_related('user')
+        .annotate(active_reply_count=Count('replies', filter=Q(replies__is_active=True)))
+    )
     serializer = CommentSerializer(comments, many=True)
     return Response(serializer.data)
 
@@ -594,30 +822,32 @@ def get_comments(request, short_id):
 @permission_classes([AllowAny])
 def track_view(request, short_id):
     try:
-        # Check if the short exists and is active
-        short = get_object_or_404(Short, id=short_id, is_active=True)
-        
-        # Increment view_count for this specific short
-        Short.objects.filter(id=short_id, is_active=True).update(
+        # Increment view_count; the matched row count doubles as the existence check
+        updated = Short.objects.filter(id=short_id, is_active=True).update(
             view_count=F('view_count') + 1
         )
+        if not updated:
+            return Response({
+                'status': 'error',
+                'message': 'Short not found'
+            }, status=status.HTTP_404_NOT_FOUND)
         
-        # Get the updated count and recalculate complete rewards
-        short.refresh_from_db()
+        # Reload the updated count without the large text/JSON columns
+        short = Short.objects.defer(*Short.HEAVY_FIELDS).get(pk=short_id)
         
         # Trigger complete reward recalculation if rewards have been calculated before
         if short.reward_calculated_at:
-            # Recalculate all reward components
+            # Recalculate all reward components and write only those columns
             short.calculate_main_reward_score()
             short.calculate_ai_bonus_percentage()
             short.calculate_final_reward_score()
-            short.save()
+            short.save(update_fields=Short.REWARD_FIELDS)
             logger.info(f"Recalculated complete rewards for Short {short.id} after view increment")
         else:
             # Try auto-calculation if this is the first time
             short.auto_calculate_rewards_if_ready()
         
-        print(f"DEBUG: View incremented for short {short_id}. New view count: {short.view_count}")
+        logger.debug("View incremented for short %s. New view count: %s", short_id, short.view_count)
         
         return Response({
             'status': 'success',
@@ -627,13 +857,31 @@ def track_view(request, short_id):
         })
         
     except Exception as e:
-        print(f"ERROR in track_view: {str(e)}")
+        logger.error("Error in track_view: %s", e)
         return Response({
             'status': 'error',
             'message': f'Failed to track view: {str(e)}'
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+# Analytics aggregate over every View of a short; hot videos share one result per window
+VIDEO_ANALYTICS_CACHE_TIMEOUT = 30
+
+
+# Seconds between per-short aggregate refreshes driven by plain watch-progress ticks
+VIEW_AGGREGATE_REFRESH_INTERVAL = 10
+
+# View columns a watch-progress tick can change
+VIEW_PROGRESS_FIELDS = (
+    'last_position', 'max_watch_position', 'watch_duration', 'watch_percentage',
+    'is_complete_view', 'engagement_score', 'rewatch_count',
+)
+
+
+def _video_analytics_cache_key(short_id):
+    return f'video-analytics:{short_id}'
+
+
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def track_watch_progress(request, short_id):
@@ -654,21 +902,6 @@ def track_watch_progress(request, short_id):
         else:
             ip_address = request.META.get('REMOTE_ADDR')
         
-        # Get or create view record - but check for existing views across all sessions
-        # First, check if user has watched this video before (in any session)
-        if request.user.is_authenticated:
-            existing_views = View.objects.filter(
-                user=request.user,
-                short=short
-            ).exclude(session_id=session_id)
-        else:
-            # For anonymous users, approximate uniqueness by IP
-            existing_views = View.objects.filter(
-                user__isnull=True,
-                short=short,
-                ip_address=ip_address
-            ).exclude(session_id=session_id)
-        
         # Get or create view record for current session
         view_record, created = View.objects.get_or_create(
             user=request.user if request.user.is_authenticated else None,
@@ -682,9 +915,19 @@ def track_watch_progress(request, short_id):
             }
         )
         
-        # If this is a new session but user has watched this video before, it's a rewatch
-        if created and existing_views.exists():
-            view_record.rewatch_count = existing_views.count()  # Count previous sessions as rewatches
+        # If this is a new session but user has watched this video before, it's a rewatch.
+        # Ongoing sessions (the common per-ping case) skip this lookup entirely.
+        if created:
+            if request.user.is_authenticated:
+                existing_views = View.objects.filter(user=request.user, short=short)
+            else:
+                # For anonymous users, approximate uniqueness by IP
+                existing_views = View.objects.filter(user__isnull=True, short=short, ip_address=ip_address)
+            previous_sessions = existing_views.exclude(session_id=session_id).count()
+            if previous_sessions:
+                view_record.rewatch_count = previous_sessions  # Count previous sessions as rewatches
+        
+        was_complete = view_record.is_complete_view
         
         # Update watch progress
         if not created:
@@ -696,7 +939,23 @@ def track_watch_progress(request, short_id):
         else:
             view_record.update_watch_progress(current_position, duration_watched)
         
-        view_record.save()
+        # New sessions and completions change the analytics; position ticks wait for the TTL
+        milestone = created or view_record.is_complete_view != was_complete
+        
+        # A full save refreshes the short's cached counts and rewards through the View
+        # signal; other ticks only persist the progress, at most one refresh per interval
+        if milestone or caches['default'].add(
+            f'view-aggregates:{short.id}', True, VIEW_AGGREGATE_REFRESH_INTERVAL
+        ):
+            view_record.save()
+        else:
+            View.objects.filter(pk=view_record.pk).update(
+                updated_at=timezone.now(),
+                **{field: getattr(view_record, field) for field in VIEW_PROGRESS_FIELDS}
+            )
+        
+        if milestone:
+            caches['default'].delete(_video_analytics_cache_key(short.id))
         
         # Calculate response data
         response_data = {
@@ -710,67 +969,106 @@ def track_watch_progress(request, short_id):
         
         return Response(response_data)
         
-    except Exception as e:
-        print(f"ERROR in track_watch_progress: {str(e)}")
+    except Exception:
+        logger.exception("Error in track_watch_progress")
         return Response({
             'status': 'error',
-            'message': f'Failed to track watch progress: {str(e)}'
+            'message': 'Failed to track watch progress'
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def get_video_analytics(request, short_id):
-    """Get comprehensive analytics for a video"""
+    """Get comprehensive analytics for a video, cached briefly per short"""
+    # Access checks run before the cache so deactivated shorts stop being served
+    short = get_object_or_404(Short, id=short_id, is_active=True)
+    cache_key = _video_analytics_cache_key(short_id)
+    analytics = caches['default'].get(cache_key)
+    if analytics is not None:
+        return Response({
+            'status': 'success',
+            'analytics': analytics
+        })
+
     try:
-        short = get_object_or_404(Short, id=short_id, is_active=True)
         analytics = short.get_analytics_summary()
+        caches['default'].set(cache_key, analytics, VIDEO_ANALYTICS_CACHE_TIMEOUT)
         
         return Response({
             'status': 'success',
             'analytics': analytics
         })
         
-    except Exception as e:
-        print(f"ERROR in get_video_analytics: {str(e)}")
+    except Exception:
+        logger.exception("Error in get_video_analytics")
         return Response({
             'status': 'error',
-            'message': f'Failed to get analytics: {str(e)}'
+            'message': 'Failed to get analytics'
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+WATCH_HISTORY_PAGE_SIZE = 50
+MAX_WATCH_HISTORY_PAGE_SIZE = 200
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def get_user_watch_history(request):
-    """Get user's watch history with engagement metrics"""
+    """Get user's watch history with engagement metrics, one page at a time"""
     try:
-        views = View.objects.filter(user=request.user).select_related('short').order_by('-updated_at')
-        
-        watch_history = []
-        for view in views:
-            watch_history.append({
-                'short_id': str(view.short.id),
-                'short_title': view.short.title or 'Untitled',
-                'watch_percentage': round(view.watch_percentage, 2),
-                'watch_duration': view.watch_duration,
-                'video_duration': view.short.duration,
-                'is_complete_view': view.is_complete_view,
-                'rewatch_count': view.rewatch_count,
-                'engagement_score': round(view.engagement_score, 2),
-                'last_watched': view.updated_at.isoformat(),
-                'first_watched': view.created_at.isoformat(),
-            })
-        
+        page = int(request.GET.get('page', 1))
+        page_size = int(request.GET.get('page_size', WATCH_HISTORY_PAGE_SIZE))
+    except ValueError:
+        return Response({
+            'status': 'error',
+            'message': 'page and page_size must be integers'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    page = max(page, 1)
+    page_size = min(max(page_size, 1), MAX_WATCH_HISTORY_PAGE_SIZE)
+    
+    try:
+        start = (page - 1) * page_size
+
+        # Fetch one extra row to learn whether another page exists without a COUNT
+        views = list(View.objects.filter(user=request.user).order_by('-updated_at').values(
+            'short_id', 'short__title', 'short__duration', 'watch_percentage', 'watch_duration',
+            'is_complete_view', 'rewatch_count', 'engagement_score', 'updated_at', 'created_at',
+        )[start:start + page_size + 1])
+        has_next = len(views) > page_size
+
+        watch_history = [
+            {
+                'short_id': str(view['short_id']),
+                'short_title': view['short__title'] or 'Untitled',
+                'watch_percentage': round(view['watch_percentage'], 2),
+                'watch_duration': view['watch_duration'],
+                'video_duration': view['short__duration'],
+                'is_complete_view': view['is_complete_view'],
+                'rewatch_count': view['rewatch_count'],
+                'engagement_score': round(view['engagement_score'], 2),
+                'last_watched': view['updated_at'].isoformat(),
+                'first_watched': view['created_at'].isoformat(),
+            }
+            for view in views[:page_size]
+        ]
+
         return Response({
             'status': 'success',
-            'watch_history': watch_history
+            'watch_history': watch_history,
+            'pagination': {
+                'page': page,
+                'page_size': page_size,
+                'has_next': has_next
+            }
         })
         
-    except Exception as e:
-        print(f"ERROR in get_user_watch_history: {str(e)}")
+    except Exception:
+        logger.exception("Error in get_user_watch_history")
         return Response({
             'status': 'error',
-            'message': f'Failed to get watch history: {str(e)}'
+            'message': 'Failed to get watch history'
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
@@ -778,9 +1076,8 @@ def get_user_watch_history(request):
 @permission_classes([IsAdminUser])
 def recalculate_short_rewards(request, short_id):
     """Admin endpoint to manually recalculate rewards for a specific short"""
+    short = get_object_or_404(Short, id=short_id, is_active=True)
     try:
-        short = get_object_or_404(Short, id=short_id, is_active=True)
-        
         # Store original values for comparison
         original_main = short.main_reward_score
         original_final = short.final_reward_score
@@ -818,10 +1115,46 @@ def recalculate_short_rewards(request, short_id):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
 
+def _with_profile_stats(users):
+    """
+    Annotate the totals UserProfileSerializer reports so nested authors and
+    commenters don't cost three queries each.
+    """
+    active = Q(shorts__is_active=True)
+    return users.annotate(
+        active_shorts_count=Count('shorts', filter=active),
+        active_total_likes=Sum('shorts__like_count', filter=active),
+        active_total_views=Sum('shorts__view_count', filter=active),
+    )
+
+
+def _shorts_for_detail(shorts, user):
+    """
+    Prefetch everything ShortSerializer renders for a list of shorts: the
+    author, each comment with its user and reply count, and is_liked.
+    """
+    profiles = _with_profile_stats(User.objects.all())
+    shorts = shorts.prefetch_related(
+        Prefetch('author', queryset=profiles),
+        Prefetch(
+            'comments',
+            queryset=Comment.objects.annotate(
+                active_reply_count=Count('replies', filter=Q(replies__is_active=True))
+            )
+        ),
+        Prefetch('comments__user', queryset=profiles),
+    )
+    if user.is_authenticated:
+        shorts = shorts.annotate(
+            liked_by_me=Exists(Like.objects.filter(short=OuterRef('pk'), user=user))
+        )
+    return shorts
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def user_shorts(request):
-    shorts = Short.objects.filter(author=request.user, is_active=True)
+    shorts = _shorts_for_detail(Short.objects.filter(author=request.user, is_active=True), request.user)
     serializer = ShortSerializer(shorts, many=True, context={'request': request})
     return Response(serializer.data)
 
@@ -829,9 +1162,9 @@ def user_shorts(request):
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def user_profile(request, username):
-    user = get_object_or_404(User, username=username)
+    user = get_object_or_404(_with_profile_stats(User.objects.all()), username=username)
     user_serializer = UserProfileSerializer(user)
-    shorts = Short.objects.filter(author=user, is_active=True)[:20]  # Latest 20 shorts
+    shorts = _shorts_for_detail(Short.objects.filter(author=user, is_active=True), request.user)[:20]  # Latest 20 shorts
     shorts_serializer = ShortSerializer(shorts, many=True, context={'request': request})
     
     return Response({
@@ -850,10 +1183,8 @@ class NoteListCreate(generics.ListCreateAPIView):
         return Note.objects.filter(author=user)
 
     def perform_create(self, serializer):
-        if serializer.is_valid():
-            serializer.save(author=self.request.user)
-        else:
-            print(serializer.errors)
+        # CreateModelMixin.create() has already run is_valid(raise_exception=True)
+        serializer.save(author=self.request.user)
 
 
 class NoteDelete(generics.DestroyAPIView):
@@ -888,9 +1219,11 @@ def wallet_transactions(request):
 @permission_classes([IsAuthenticated])
 def verify_transaction(request, transaction_id):
     """Verify a specific transaction's integrity using cryptographic hash"""
+    # The hash covers plain columns and FK ids only, so no related rows are needed
+    transaction = get_object_or_404(
+        Transaction.objects.defer('digital_signature'), id=transaction_id, wallet__user=request.user
+    )
     try:
-        transaction = get_object_or_404(Transaction, id=transaction_id, wallet__user=request.user)
-        
         verification_result = {
             'transaction_id': str(transaction.id),
             'transaction_hash': transaction.transaction_hash,
@@ -924,12 +1257,20 @@ def audit_log(request):
 def wallet_integrity_report(request):
     """Generate a comprehensive integrity report for the user's wallet"""
     wallet, created = Wallet.objects.get_or_create(user=request.user)
-    transactions = Transaction.objects.filter(wallet=wallet)
+    # Stream the chain oldest first so each predecessor has already been hashed into
+    # verified_hashes when its successor is checked; only that map stays in memory
+    transactions = Transaction.objects.filter(wallet=wallet).defer('digital_signature').order_by('created_at')
+    verified_hashes = {}
     
-    total_transactions = transactions.count()
-    verified_transactions = sum(1 for tx in transactions if tx.verify_integrity())
-    chain_valid_transactions = sum(1 for tx in transactions if tx.get_chain_validity())
-    confirmed_transactions = transactions.filter(is_confirmed=True).count()
+    total_transactions = verified_transactions = chain_valid_transactions = confirmed_transactions = 0
+    for tx in transactions.iterator(chunk_size=500):
+        verified = tx.verify_integrity()
+        verified_hashes[tx.transaction_hash] = verified
+        
+        total_transactions += 1
+        verified_transactions += verified
+        chain_valid_transactions += tx.get_chain_validity(verified_hashes)
+        confirmed_transactions += tx.is_confirmed
     
     integrity_report = {
         'wallet_id': wallet.id,
@@ -958,27 +1299,20 @@ def create_reward_transaction(user, transaction_type, amount, description, relat
     # Convert amount to Decimal to avoid type errors
     amount_decimal = Decimal(str(amount))
     
-    # Ensure wallet balances are Decimal types
-    if not isinstance(wallet.balance, Decimal):
-        wallet.balance = Decimal(str(wallet.balance))
-    if not isinstance(wallet.total_earnings, Decimal):
-        wallet.total_earnings = Decimal(str(wallet.total_earnings))
-    
-    # Create transaction with blockchain-inspired security
+    # Create transaction with blockchain-inspired security, already confirmed
+    # (in blockchain, confirmation would be mining/consensus). The Transaction
+    # post_save signal credits the wallet.
     transaction = Transaction.objects.create(
         wallet=wallet,
         transaction_type=transaction_type,
         amount=amount_decimal,
         description=description,
         related_short=related_short,
-        nonce=0  # Could implement proof-of-work concept if needed
+        nonce=0,  # Could implement proof-of-work concept if needed
+        is_confirmed=True,
+        confirmation_count=1  # Simulate network confirmations
     )
     
-    # Update wallet balances with proper Decimal arithmetic
-    wallet.balance = wallet.balance + amount_decimal
-    wallet.total_earnings = wallet.total_earnings + amount_decimal
-    wallet.save()
-    
     # Create immutable audit log entry
     AuditLog.objects.create(
         action_type='transaction_created',
@@ -993,11 +1327,6 @@ def create_reward_transaction(user, transaction_type, amount, description, relat
         }
     )
     
-    # Confirm transaction (in blockchain, this would be mining/consensus)
-    transaction.is_confirmed = True
-    transaction.confirmation_count = 1  # Simulate network confirmations
-    transaction.save(update_fields=['is_confirmed', 'confirmation_count'])
-    
     return transaction
 
 
@@ -1063,8 +1392,9 @@ def analyze_comment(request, comment_id):
 
     Expected payload (optional): {"force": true} to re-analyze already analyzed comments
     """
+    comment = get_object_or_404(Comment, id=comment_id, is_active=True)
+
     try:
-        comment = get_object_or_404(Comment, id=comment_id, is_active=True)
         force = request.data.get('force', False)
 
         service = CommentAnalysisService()
@@ -1084,11 +1414,6 @@ def analyze_comment(request, comment_id):
             'analyzed_at': comment.analyzed_at.isoformat() if comment.analyzed_at else None
         })
 
-    except Comment.DoesNotExist:
-        return Response({
-            'success': False,
-            'error': 'Comment not found'
-        }, status=status.HTTP_404_NOT_FOUND)
     except Exception as e:
         logger.error(f"Error analyzing comment {comment_id}: {str(e)}")
         return Response({
@@ -1109,8 +1434,9 @@ def analyze_comments_for_short(request, short_id):
     - {"force": true} to re-analyze already analyzed comments
     - {"update_aggregate": true} to update the Short's aggregate score
     """
+    short = get_object_or_404(Short, id=short_id, is_active=True)
+
     try:
-        short = get_object_or_404(Short, id=short_id, is_active=True)
         force = request.data.get('force', False)
         update_aggregate = request.data.get('update_aggregate', True)
 
@@ -1131,11 +1457,6 @@ def analyze_comments_for_short(request, short_id):
 
         return Response(response_data)
 
-    except Short.DoesNotExist:
-        return Response({
-            'success': False,
-            'error': 'Short not found'
-        }, status=status.HTTP_404_NOT_FOUND)
     except Exception as e:
         logger.error(f"Error analyzing comments for short {short_id}: {str(e)}")
         return Response({
@@ -1144,87 +1465,89 @@ def analyze_comments_for_short(request, short_id):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-@api_view(['POST'])
-@permission_classes([IsAuthenticated])
-def batch_analyze_comments(request):
+def _batch_analyze_comments(short_ids, update_aggregates=True):
     """
-    Batch analyze comments across multiple shorts.
-
-    API endpoint for large-scale comment sentiment analysis.
-
-    Expected payload:
-    - short_ids: List of short IDs to process
-    - force: (optional) Re-analyze already processed comments
-    - update_aggregates: (optional) Update Short aggregate scores
+    Analyze comments for each short in short_ids and log a summary.
+    Runs on BATCH_ANALYSIS_EXECUTOR, off the request thread.
     """
     try:
-        short_ids = request.data.get('short_ids', [])
-        force = request.data.get('force', False)
-        update_aggregates = request.data.get('update_aggregates', True)
-
-        if not short_ids:
-            return Response({
-                'success': False,
-                'error': 'short_ids is required'
-            }, status=status.HTTP_400_BAD_REQUEST)
-
         service = CommentAnalysisService()
         total_shorts = 0
         total_comments = 0
         total_errors = 0
-        results = []
 
+        # Fetch every requested short in one query rather than one per id
+        valid_ids = []
         for short_id in short_ids:
             try:
-                short = Short.objects.get(id=short_id, is_active=True)
+                valid_ids.append(uuid.UUID(str(short_id)))
+            except ValueError:
+                logger.warning("Batch comment analysis skipped invalid short id %s", short_id)
+        shorts = Short.objects.filter(id__in=valid_ids, is_active=True).prefetch_related(
+            Prefetch(
+                'comments',
+                queryset=Comment.objects.filter(is_active=True, sentiment_score__isnull=True),
+                to_attr='pending_comments'
+            )
+        ).in_bulk()
+
+        for short_id in valid_ids:
+            short = shorts.get(short_id)
+            if short is None:
+                logger.warning("Batch comment analysis skipped missing short %s", short_id)
+                continue
+
+            try:
                 result = service.analyze_comments_for_short(short, update_aggregate=update_aggregates)
 
                 total_shorts += 1
                 total_comments += result.get('comments_analyzed', 0)
                 total_errors += result.get('errors', 0)
 
-                results.append({
-                    'short_id': str(short_id),
-                    'short_title': short.title or 'Untitled',
-                    'comments_analyzed': result.get('comments_analyzed', 0),
-                    'errors': result.get('errors', 0),
-                    'aggregate_score': result.get('aggregate_score')
-                })
-
-            except Short.DoesNotExist:
-                results.append({
-                    'short_id': str(short_id),
-                    'error': 'Short not found'
-                })
             except Exception as e:
                 logger.error(f"Error processing short {short_id}: {str(e)}")
-                results.append({
-                    'short_id': str(short_id),
-                    'error': str(e)
-                })
 
-        response_data = {
-            'success': True,
-            'summary': {
-                'total_shorts_processed': total_shorts,
-                'total_comments_analyzed': total_comments,
-                'total_errors': total_errors,
-                'success_rate': (total_comments / (total_comments + total_errors) * 100) if (total_comments + total_errors) > 0 else 0
-            },
-            'results': results
-        }
+        logger.info(
+            "Batch comment analysis finished: %s shorts, %s comments analyzed, %s errors",
+            total_shorts, total_comments, total_errors
+        )
 
-        if total_errors > 0:
-            response_data['warning'] = f"{total_errors} comments failed to analyze"
+    except Exception:
+        logger.exception("Error in batch analysis")
 
-        return Response(response_data)
 
-    except Exception as e:
-        logger.error(f"Error in batch analysis: {str(e)}")
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def batch_analyze_comments(request):
+    """
+    Batch analyze comments across multiple shorts.
+
+    API endpoint for large-scale comment sentiment analysis. The work is
+    queued on the shared analysis pool and the request returns immediately;
+    per-short results are available from the comment sentiment summary
+    endpoint once processed.
+
+    Expected payload:
+    - short_ids: List of short IDs to process
+    - force: (optional) Re-analyze already processed comments
+    - update_aggregates: (optional) Update Short aggregate scores
+    """
+    short_ids = request.data.get('short_ids', [])
+    update_aggregates = request.data.get('update_aggregates', True)
+
+    if not short_ids:
         return Response({
             'success': False,
-            'error': f'Batch analysis failed: {str(e)}'
-        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            'error': 'short_ids is required'
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    BATCH_ANALYSIS_EXECUTOR.submit(_batch_analyze_comments, list(short_ids), update_aggregates)
+
+    return Response({
+        'success': True,
+        'message': f'Comment analysis queued for {len(short_ids)} shorts',
+        'short_ids': [str(short_id) for short_id in short_ids]
+    }, status=status.HTTP_202_ACCEPTED)
 
 
 @api_view(['GET'])
@@ -1235,9 +1558,9 @@ def get_comment_sentiment_summary(request, short_id):
 
     Returns statistics about comment sentiment distribution and averages.
     """
-    try:
-        short = get_object_or_404(Short, id=short_id, is_active=True)
+    short = get_object_or_404(Short, id=short_id, is_active=True)
 
+    try:
         service = CommentAnalysisService()
         summary = service.get_short_sentiment_summary(short)
 
@@ -1247,11 +1570,6 @@ def get_comment_sentiment_summary(request, short_id):
             'summary': summary
         })
 
-    except Short.DoesNotExist:
-        return Response({
-            'success': False,
-            'error': 'Short not found'
-        }, status=status.HTTP_404_NOT_FOUND)
     except Exception as e:
         logger.error(f"Error getting sentiment summary for short {short_id}: {str(e)}")
         return Response({
@@ -1323,16 +1641,17 @@ def analyze_single_video(request):
                 status=status.HTTP_503_SERVICE_UNAVAILABLE
             )
         
-        # Check if analysis is already in progress
-        if short.video_analysis_status == 'processing':
+        # Claim the short by flipping its status to processing in one conditional UPDATE,
+        # so two concurrent requests can't both start a Gemini run
+        claimed = Short.objects.filter(pk=short.pk).exclude(
+            video_analysis_status='processing'
+        ).update(video_analysis_status='processing')
+        if not claimed:
             return Response(
                 {'message': 'Video analysis is already in progress'}, 
                 status=status.HTTP_409_CONFLICT
             )
-        
-        # Set status to processing
         short.video_analysis_status = 'processing'
-        short.save(update_fields=['video_analysis_status'])
         
         try:
             # Analyze the video
@@ -1340,44 +1659,8 @@ def analyze_single_video(request):
             analysis_result = gemini_video_service.analyze_video(video_path)
             
             if analysis_result.get('success', False):
-                # Update the short with enhanced analysis data
-                short.video_analysis_summary = analysis_result.get('summary', '')
-                short.video_analysis_status = 'completed'
-                short.video_analysis_processed_at = timezone.now()
-                short.video_analysis_error = None
-                
-                # Enhanced analysis fields - updated for balanced scoring
-                short.video_content_engagement = analysis_result.get('content_engagement', 50)
-                short.video_demographic_appeal = analysis_result.get('audience_appeal', 50)  # audience_appeal maps to demographic_appeal
-                short.video_content_focus = analysis_result.get('quality_score', 50)  # quality includes focus/clarity
-                short.video_content_sensitivity = analysis_result.get('content_sensitivity', 5)
-                short.video_originality = analysis_result.get('originality', 50)
-                short.video_technical_quality = analysis_result.get('quality_score', 50)  # quality_score includes technical
-                short.video_viral_potential = analysis_result.get('viral_potential', 50)
-                short.video_overall_score = analysis_result.get('overall_score', 50)
-                
-                # Store detailed summary if available
-                detailed_summary = analysis_result.get('detailed_summary', '')
-                if detailed_summary:
-                    short.video_analysis_summary = detailed_summary
-                
-                # Legacy support - remove unused fields in new system
-                short.video_detailed_breakdown = {}  # Simplified system doesn't use this
-                short.video_demographic_analysis = {}  # Simplified system doesn't use this
-                
-                # Maintain legacy fields for backward compatibility
-                short.video_quality_score = analysis_result.get('quality_score', 50)  # Use new quality_score
-                short.video_engagement_prediction = analysis_result.get('content_engagement', 50)
-                short.video_sentiment_score = analysis_result.get('sentiment_score', 0)  # Not part of new system
-                short.video_content_categories = analysis_result.get('content_categories', [])
-                
-                short.save(update_fields=[
-                    'video_analysis_summary', 'video_analysis_status', 'video_analysis_processed_at', 'video_analysis_error',
-                    'video_content_engagement', 'video_demographic_appeal', 'video_content_focus', 'video_content_sensitivity',
-                    'video_originality', 'video_technical_quality', 'video_viral_potential', 'video_overall_score',
-                    'video_detailed_breakdown', 'video_demographic_analysis',
-                    'video_quality_score', 'video_engagement_prediction', 'video_sentiment_score', 'video_content_categories'
-                ])
+                update_fields = _apply_video_analysis_result(short, analysis_result)
+                short.save(update_fields=update_fields)
                 
                 return Response({
                     'success': True,
@@ -1437,7 +1720,7 @@ def get_video_analysis(request, short_id):
         short = get_object_or_404(Short, id=short_id, is_active=True)
         
         # Check if user can access this video (author or public)
-        if short.author != request.user:
+        if short.author_id != request.user.id:
             # For now, allow anyone to see analysis of public videos
             # You can modify this based on your privacy requirements
             pass
@@ -1471,11 +1754,118 @@ def get_video_analysis(request, short_id):
         return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+# Fields written back once a batch of video analyses finishes
+LEGACY_VIDEO_ANALYSIS_FIELDS = [
+    'video_quality_score', 'video_analysis_summary', 'video_content_categories',
+    'video_engagement_prediction', 'video_sentiment_score', 'video_analysis_status',
+    'video_analysis_processed_at', 'video_analysis_error'
+]
+
+
+def _apply_legacy_video_analysis_result(short, analysis_result):
+    """
+    Copy a Gemini analysis result onto the legacy video_* fields of short without saving it
+    """
+    if analysis_result.get('success', False):
+        short.video_quality_score = analysis_result.get('quality_score', 0)
+        short.video_analysis_summary = analysis_result.get('summary', '')
+        short.video_content_categories = analysis_result.get('content_categories', [])
+        short.video_engagement_prediction = analysis_result.get('engagement_prediction', 0)
+        short.video_sentiment_score = analysis_result.get('sentiment_score', 0)
+        short.video_analysis_status = 'completed'
+        short.video_analysis_processed_at = timezone.now()
+        short.video_analysis_error = None
+    else:
+        short.video_analysis_status = 'failed'
+        short.video_analysis_error = analysis_result.get('error', 'Unknown analysis error')
+
+
+def _release_video_analysis_claims(short_ids, error):
+    """
+    Mark claimed shorts that never got a result as failed so a later batch
+    (which only picks pending/failed videos) can retry them
+    """
+    if short_ids:
+        Short.objects.filter(
+            id__in=short_ids, video_analysis_status='processing'
+        ).update(video_analysis_status='failed', video_analysis_error=error)
+
+
+def _analyze_videos_in_background(short_ids):
+    """
+    Run Gemini video analysis for each short in short_ids.
+    Runs on BATCH_ANALYSIS_EXECUTOR; gemini_rate_limiter paces the API calls.
+    """
+    analyzed_shorts = []
+    written_ids = set()
+    
+    try:
+        for short in Short.objects.filter(id__in=short_ids):
+            try:
+                _apply_legacy_video_analysis_result(short, gemini_video_service.analyze_video(short.video.path))
+            except Exception as e:
+                logger.error(f"Error analyzing video for short {short.id}: {e}")
+                short.video_analysis_status = 'failed'
+                short.video_analysis_error = str(e)
+            analyzed_shorts.append(short)
+    except Exception:
+        logger.exception("Batch video analysis stopped early")
+    finally:
+        # One batched write for everything analysed, even if the run stopped early
+        try:
+            Short.objects.bulk_update(analyzed_shorts, LEGACY_VIDEO_ANALYSIS_FIELDS, batch_size=500)
+            written_ids = {short.id for short in analyzed_shorts}
+            # bulk_update sends no post_save, so invalidate the reports here
+            invalidate_video_analysis_reports(short.author_id for short in analyzed_shorts)
+        except Exception:
+            logger.exception("Failed to save batch video analysis results")
+        _release_video_analysis_claims(
+            [short_id for short_id in short_ids if short_id not in written_ids],
+            'Batch analysis stopped before this video was analyzed',
+        )
+    
+    successful_count = sum(short.video_analysis_status == 'completed' for short in analyzed_shorts)
+    logger.info(f"Batch video analysis completed: {successful_count}/{len(short_ids)} successful")
+
+
+def _queue_video_analysis(short_ids):
+    """
+    Claim the shorts in short_ids that are still pending or failed, and analyze
+    those on BATCH_ANALYSIS_EXECUTOR. The claim is conditional, so a concurrent
+    request can't queue the same videos; it is released if the job can't be
+    queued or is cancelled before it runs. Returns the ids this call claimed.
+    """
+    with transaction.atomic():
+        claimed_ids = list(Short.objects.select_for_update().filter(
+            id__in=short_ids, video_analysis_status__in=['pending', 'failed']
+        ).values_list('id', flat=True))
+        Short.objects.filter(id__in=claimed_ids).update(video_analysis_status='processing')
+    
+    if not claimed_ids:
+        return claimed_ids
+    
+    try:
+        future = BATCH_ANALYSIS_EXECUTOR.submit(_analyze_videos_in_background, claimed_ids)
+    except Exception:
+        _release_video_analysis_claims(claimed_ids, 'Video analysis could not be queued')
+        raise
+    
+    def release_if_cancelled(future):
+        # Queued jobs are cancelled when the pool shuts down
+        if future.cancelled():
+            _release_video_analysis_claims(claimed_ids, 'Video analysis was cancelled before it ran')
+    
+    future.add_done_callback(release_if_cancelled)
+    return claimed_ids
+
+
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def batch_analyze_videos(request):
     """
-    Trigger analysis for all user's videos that haven't been analyzed yet
+    Queue analysis for the user's videos that haven't been analyzed yet.
+    The videos are marked processing and analyzed in the background; poll
+    the video analysis endpoint for each short's results.
     """
     try:
         if not gemini_video_service.is_available():
@@ -1485,104 +1875,48 @@ def batch_analyze_videos(request):
             )
         
         # Get all user's videos that need analysis
-        videos_to_analyze = Short.objects.filter(
+        short_ids = list(Short.objects.filter(
             author=request.user,
             is_active=True,
             video_analysis_status__in=['pending', 'failed']
-        )[:10]  # Limit to 10 videos at once to avoid overwhelming the API
+        ).values_list('id', flat=True)[:10])  # Limit to 10 videos at once to avoid overwhelming the API
         
-        if not videos_to_analyze.exists():
+        # A concurrent request may have claimed some of them in the meantime
+        short_ids = _queue_video_analysis(short_ids) if short_ids else []
+        
+        if not short_ids:
             return Response({
                 'message': 'No videos need analysis',
                 'analyzed_count': 0
             }, status=status.HTTP_200_OK)
         
-        results = []
-        successful_count = 0
-        
-        for short in videos_to_analyze:
-            try:
-                # Set status to processing
-                short.video_analysis_status = 'processing'
-                short.save(update_fields=['video_analysis_status'])
-                
-                # Analyze the video
-                video_path = short.video.path
-                analysis_result = gemini_video_service.analyze_video(video_path)
-                
-                if analysis_result.get('success', False):
-                    # Update the short with analysis data
-                    short.video_quality_score = analysis_result.get('quality_score', 0)
-                    short.video_analysis_summary = analysis_result.get('summary', '')
-                    short.video_content_categories = analysis_result.get('content_categories', [])
-                    short.video_engagement_prediction = analysis_result.get('engagement_prediction', 0)
-                    short.video_sentiment_score = analysis_result.get('sentiment_score', 0)
-                    short.video_analysis_status = 'completed'
-                    short.video_analysis_processed_at = timezone.now()
-                    short.video_analysis_error = None
-                    
-                    short.save(update_fields=[
-                        'video_quality_score', 'video_analysis_summary', 'video_content_categories',
-                        'video_engagement_prediction', 'video_sentiment_score', 'video_analysis_status',
-                        'video_analysis_processed_at', 'video_analysis_error'
-                    ])
-                    
-                    successful_count += 1
-                    results.append({
-                        'short_id': str(short.id),
-                        'title': short.title,
-                        'success': True,
-                        'quality_score': short.video_quality_score,
-                    })
-                else:
-                    # Analysis failed
-                    error_msg = analysis_result.get('error', 'Unknown analysis error')
-                    short.video_analysis_status = 'failed'
-                    short.video_analysis_error = error_msg
-                    short.save(update_fields=['video_analysis_status', 'video_analysis_error'])
-                    
-                    results.append({
-                        'short_id': str(short.id),
-                        'title': short.title,
-                        'success': False,
-                        'error': error_msg
-                    })
-                
-                # Add delay between requests to respect rate limits
-                import time
-                time.sleep(1)
-                
-            except Exception as e:
-                short.video_analysis_status = 'failed'
-                short.video_analysis_error = str(e)
-                short.save(update_fields=['video_analysis_status', 'video_analysis_error'])
-                
-                results.append({
-                    'short_id': str(short.id),
-                    'title': short.title,
-                    'success': False,
-                    'error': str(e)
-                })
-        
         return Response({
             'success': True,
-            'message': f'Batch analysis completed: {successful_count}/{len(results)} successful',
-            'analyzed_count': successful_count,
-            'total_processed': len(results),
-            'results': results
-        }, status=status.HTTP_200_OK)
+            'message': f'Batch analysis queued for {len(short_ids)} videos',
+            'queued_count': len(short_ids),
+            'short_ids': [str(short_id) for short_id in short_ids]
+        }, status=status.HTTP_202_ACCEPTED)
     
     except Exception as e:
         logger.error(f"Error in batch_analyze_videos: {e}")
         return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+# Per-user analysis report; signals drop it whenever a reported Short field is written
+VIDEO_ANALYSIS_REPORT_CACHE_TIMEOUT = 300
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def video_analysis_report(request):
     """
     Get a comprehensive report of all analyzed videos for the user
     """
+    cache_key = video_analysis_report_cache_key(request.user.id)
+    report = caches['reports'].get(cache_key)
+    if report is not None:
+        return Response(report, status=status.HTTP_200_OK)
+    
     try:
         # Get all user's analyzed videos
         analyzed_videos = Short.objects.filter(
@@ -1592,41 +1926,51 @@ def video_analysis_report(request):
             video_quality_score__isnull=False,
         )
         
-        if not analyzed_videos.exists():
+        # Summary statistics and quality distribution in one query
+        stats = analyzed_videos.aggregate(
+            total=Count('id'),
+            avg_quality=Avg('video_quality_score'),
+            avg_engagement=Avg(Coalesce('video_engagement_prediction', 0.0)),
+            avg_sentiment=Avg(Coalesce('video_sentiment_score', 0.0)),
+            excellent=Count('id', filter=Q(video_quality_score__gte=80)),
+            good=Count('id', filter=Q(video_quality_score__gte=60, video_quality_score__lt=80)),
+            fair=Count('id', filter=Q(video_quality_score__gte=40, video_quality_score__lt=60)),
+            poor=Count('id', filter=Q(video_quality_score__lt=40)),
+        )
+        
+        total_videos = stats['total']
+        if not total_videos:
             return Response({
                 'message': 'No analyzed videos found',
                 'total_videos': 0
             }, status=status.HTTP_200_OK)
         
-        # Calculate summary statistics
-        total_videos = analyzed_videos.count()
-        avg_quality = sum(v.video_quality_score for v in analyzed_videos) / total_videos
-        avg_engagement = sum(v.video_engagement_prediction or 0 for v in analyzed_videos) / total_videos
-        avg_sentiment = sum(v.video_sentiment_score or 0 for v in analyzed_videos) / total_videos
+        avg_quality = stats['avg_quality']
+        avg_engagement = stats['avg_engagement']
+        avg_sentiment = stats['avg_sentiment']
         
         # Quality distribution
         quality_distribution = {
-            'excellent': analyzed_videos.filter(video_quality_score__gte=80).count(),
-            'good': analyzed_videos.filter(video_quality_score__gte=60, video_quality_score__lt=80).count(),
-            'fair': analyzed_videos.filter(video_quality_score__gte=40, video_quality_score__lt=60).count(),
-            'poor': analyzed_videos.filter(video_quality_score__lt=40).count()
+            'excellent': stats['excellent'],
+            'good': stats['good'],
+            'fair': stats['fair'],
+            'poor': stats['poor']
         }
         
-        # Collect all categories
-        all_categories = []
-        for video in analyzed_videos:
-            if video.video_content_categories:
-                all_categories.extend(video.video_content_categories)
-        
-        # Count category frequency
-        category_counts = {}
-        for category in all_categories:
-            category_counts[category] = category_counts.get(category, 0) + 1
+        # Plain rows with just the reported columns; categories are counted from the same fetch
+        videos = list(analyzed_videos.order_by('-video_analysis_processed_at').values(
+            'id', 'title', 'video_quality_score', 'video_engagement_prediction',
+            'video_sentiment_score', 'video_content_categories', 'video_analysis_summary',
+            'video_analysis_processed_at',
+        ))
         
-        # Top categories
-        top_categories = sorted(category_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+        # Top categories across all analyzed videos
+        category_counts = Counter(chain.from_iterable(
+            video['video_content_categories'] or () for video in videos
+        ))
+        top_categories = category_counts.most_common(5)
         
-        return Response({
+        report = {
             'success': True,
             'summary': {
                 'total_analyzed_videos': total_videos,
@@ -1637,16 +1981,19 @@ def video_analysis_report(request):
                 'top_content_categories': top_categories
             },
             'videos': [{
-                'id': str(video.id),
-                'title': video.title,
-                'quality_score': video.video_quality_score,
-                'engagement_prediction': video.video_engagement_prediction,
-                'sentiment_score': video.video_sentiment_score,
-                'content_categories': video.video_content_categories,
-                'summary': video.video_analysis_summary[:200] + '...' if len(video.video_analysis_summary or '') > 200 else video.video_analysis_summary,
-                'processed_at': video.video_analysis_processed_at
-            } for video in analyzed_videos.order_by('-video_analysis_processed_at')]
-        }, status=status.HTTP_200_OK)
+                'id': str(video['id']),
+                'title': video['title'],
+                'quality_score': video['video_quality_score'],
+                'engagement_prediction': video['video_engagement_prediction'],
+                'sentiment_score': video['video_sentiment_score'],
+                'content_categories': video['video_content_categories'],
+                'summary': video['video_analysis_summary'][:200] + '...' if len(video['video_analysis_summary'] or '') > 200 else video['video_analysis_summary'],
+                'processed_at': video['video_analysis_processed_at']
+            } for video in videos]
+        }
+        caches['reports'].set(cache_key, report, VIDEO_ANALYSIS_REPORT_CACHE_TIMEOUT)
+        
+        return Response(report, status=status.HTTP_200_OK)
     
     except Exception as e:
         logger.error(f"Error generating video analysis report: {e}")
@@ -1661,52 +2008,25 @@ def trigger_automatic_analysis(request):
     """
     try:
         # Get videos uploaded in the last hour that haven't been analyzed
-        from django.utils import timezone
         from datetime import timedelta
         
-        recent_videos = Short.objects.filter(
-            created_at__gte=timezone.now() - timedelta(hours=1),
-            video_analysis_status='pending'
-        )
+        short_ids = []
+        if gemini_video_service.is_available():
+            short_ids = list(Short.objects.filter(
+                created_at__gte=timezone.now() - timedelta(hours=1),
+                video_analysis_status='pending'
+            ).values_list('id', flat=True))
         
-        processed_count = 0
-        for video in recent_videos:
-            try:
-                # Trigger video analysis
-                if gemini_video_service.is_available():
-                    video.video_analysis_status = 'processing'
-                    video.save(update_fields=['video_analysis_status'])
-                    
-                    # Analyze the video
-                    analysis_result = gemini_video_service.analyze_video(video.video.path)
-                    
-                    if analysis_result.get('success', False):
-                        video.video_quality_score = analysis_result.get('quality_score', 0)
-                        video.video_analysis_summary = analysis_result.get('summary', '')
-                        video.video_content_categories = analysis_result.get('content_categories', [])
-                        video.video_engagement_prediction = analysis_result.get('engagement_prediction', 0)
-                        video.video_sentiment_score = analysis_result.get('sentiment_score', 0)
-                        video.video_analysis_status = 'completed'
-                        video.video_analysis_processed_at = timezone.now()
-                        video.video_analysis_error = None
-                    else:
-                        video.video_analysis_status = 'failed'
-                        video.video_analysis_error = analysis_result.get('error', 'Unknown error')
-                    
-                    video.save()
-                    processed_count += 1
-                    
-            except Exception as e:
-                logger.error(f"Error in automatic analysis for video {video.id}: {e}")
-                video.video_analysis_status = 'failed'
-                video.video_analysis_error = str(e)
-                video.save()
+        if short_ids:
+            # Same background job and claim handling as batch_analyze_videos;
+            # only the videos this request claimed are reported as queued
+            short_ids = _queue_video_analysis(short_ids)
         
         return Response({
             'success': True,
-            'message': f'Automatic analysis completed for {processed_count} videos',
-            'processed_count': processed_count
-        }, status=status.HTTP_200_OK)
+            'message': f'Automatic analysis queued for {len(short_ids)} videos',
+            'queued_count': len(short_ids)
+        }, status=status.HTTP_202_ACCEPTED)
         
     except Exception as e:
         logger.error(f"Error in trigger_automatic_analysis: {e}")
@@ -1720,16 +2040,16 @@ def calculate_short_rewards(request, short_id):
     """
     Calculate and assign rewards for a specific short
     """
+    short = get_object_or_404(Short, id=short_id, is_active=True)
+    
+    # Check if user owns the short or is admin; compare ids so the author isn't loaded
+    if short.author_id != request.user.id and not request.user.is_staff:
+        return Response(
+            {'error': 'Permission denied'}, 
+            status=status.HTTP_403_FORBIDDEN
+        )
+    
     try:
-        short = get_object_or_404(Short, id=short_id, is_active=True)
-        
-        # Check if user owns the short or is admin
-        if short.author != request.user and not request.user.is_staff:
-            return Response(
-                {'error': 'Permission denied'}, 
-                status=status.HTTP_403_FORBIDDEN
-            )
-        
         from .reward_service import ContentCreatorRewardService
         reward_service = ContentCreatorRewardService()
         
@@ -1769,16 +2089,16 @@ def process_short_payout(request, short_id):
     """
     Process payout for a specific short's accumulated rewards
     """
+    short = get_object_or_404(Short, id=short_id, is_active=True)
+    
+    # Check if user owns the short or is admin; compare ids so the author isn't loaded
+    if short.author_id != request.user.id and not request.user.is_staff:
+        return Response(
+            {'error': 'Permission denied'}, 
+            status=status.HTTP_403_FORBIDDEN
+        )
+    
     try:
-        short = get_object_or_404(Short, id=short_id, is_active=True)
-        
-        # Check if user owns the short or is admin
-        if short.author != request.user and not request.user.is_staff:
-            return Response(
-                {'error': 'Permission denied'}, 
-                status=status.HTTP_403_FORBIDDEN
-            )
-        
         from .reward_service import ContentCreatorRewardService
         reward_service = ContentCreatorRewardService()
         
@@ -1929,6 +2249,12 @@ def admin_batch_process_payouts(request):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+# System-wide totals change with every reward calculation and payout, so they are
+# only shared briefly rather than invalidated on each of those writes
+ADMIN_REWARD_DASHBOARD_CACHE_KEY = 'admin-reward-dashboard'
+ADMIN_REWARD_DASHBOARD_CACHE_TIMEOUT = 60
+
+
 @api_view(['GET'])
 @permission_classes([IsAdminUser])
 def admin_reward_dashboard(request):
@@ -1936,11 +2262,14 @@ def admin_reward_dashboard(request):
     Admin dashboard with comprehensive reward system statistics
     """
     try:
-        from .reward_service import ContentCreatorRewardService
-        reward_service = ContentCreatorRewardService()
-        
-        # Get dashboard data
-        dashboard = reward_service.get_admin_dashboard()
+        # Get dashboard data; the system-wide aggregates are shared by all admins for a minute
+        dashboard = caches['reports'].get(ADMIN_REWARD_DASHBOARD_CACHE_KEY)
+        if dashboard is None:
+            from .reward_service import ContentCreatorRewardService
+            reward_service = ContentCreatorRewardService()
+            
+            dashboard = reward_service.get_admin_dashboard()
+            caches['reports'].set(ADMIN_REWARD_DASHBOARD_CACHE_KEY, dashboard, ADMIN_REWARD_DASHBOARD_CACHE_TIMEOUT)
         
         return Response({
             'success': True,
@@ -1983,6 +2312,9 @@ def reward_history(request):
             author=request.user,
             is_active=True,
             reward_calculated_at__isnull=False
+        ).only(
+            'id', 'title', 'main_reward_score', 'ai_bonus_percentage', 'moderation_adjustment',
+            'final_reward_score', 'reward_calculated_at', 'view_count', 'like_count', 'comment_count'
         ).order_by('-reward_calculated_at')
         
         page = int(request.GET.get('page', 1))
@@ -1991,7 +2323,16 @@ def reward_history(request):
         # Simple pagination
         start = (page - 1) * page_size
         end = start + page_size
-        paginated_shorts = user_shorts[start:end]
+        # One extra row tells us whether another page follows
+        paginated_shorts = list(user_shorts[start:end + 1])
+        has_next = len(paginated_shorts) > page_size
+        paginated_shorts = paginated_shorts[:page_size]
+        
+        # A short last page already tells us the total; only count when it can't
+        if not has_next and (paginated_shorts or start == 0):
+            total_count = start + len(paginated_shorts)
+        else:
+            total_count = user_shorts.count()
         
         history = []
         for short in paginated_shorts:
@@ -2016,8 +2357,8 @@ def reward_history(request):
             'pagination': {
                 'page': page,
                 'page_size': page_size,
-                'total_count': user_shorts.count(),
-                'has_next': end < user_shorts.count()
+                'total_count': total_count,
+                'has_next': has_next
             }
         })
         
@@ -2157,6 +2498,11 @@ def process_monthly_payouts(request):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+# Per-creator monthly points shared by every creator's earnings view; dropped when
+# shorts are deactivated or bulk-scored, the timeout bounds engagement drift
+MONTHLY_POINTS_TOTAL_CACHE_TIMEOUT = 300
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def my_monthly_earnings(request):
@@ -2168,20 +2514,31 @@ def my_monthly_earnings(request):
         year = int(request.GET.get('year', timezone.now().year))
         month = int(request.GET.get('month', timezone.now().month))
         
-        # Get all creator points for the month
-        all_creator_points = monthly_revenue_service.get_monthly_creator_points(year, month)
-        
-        # Find current user's data
-        user_data = all_creator_points.get(request.user.id, {
+        # Only the current user's shorts are scored per request
+        user_points = monthly_revenue_service.get_monthly_creator_points(year, month, creator=request.user)
+        user_data = user_points.get(request.user.id, {
             'user': request.user,
             'username': request.user.username,
             'total_points': 0,
-            'shorts_count': 0,
+            'video_count': 0,
             'shorts': []
         })
         
+        # Other creators' points are the same for every caller, so they're computed once;
+        # the caller's fresh points replace their cached entry to keep the share consistent
+        creator_totals = caches['reports'].get_or_set(
+            monthly_points_total_cache_key(year, month),
+            lambda: {
+                creator_id: data['total_points']
+                for creator_id, data in monthly_revenue_service.get_monthly_creator_points(year, month).items()
+            },
+            MONTHLY_POINTS_TOTAL_CACHE_TIMEOUT,
+        )
+        total_points = user_data['total_points'] + sum(
+            points for creator_id, points in creator_totals.items() if creator_id != request.user.id
+        )
+        
         # Calculate user's percentage of total points
-        total_points = sum(data['total_points'] for data in all_creator_points.values())
         user_percentage = (user_data['total_points'] / total_points * 100) if total_points > 0 else 0
         
         return Response({
@@ -2189,7 +2546,7 @@ def my_monthly_earnings(request):
             'year': year,
             'month': month,
             'user_points': user_data['total_points'],
-            'shorts_count': user_data['shorts_count'],
+            'shorts_count': user_data['video_count'],
             'total_points_all_creators': total_points,
             'user_percentage': round(user_percentage, 4),
             'shorts': user_data['shorts'],
@@ -7,6 +7,7 @@ Generated by 'django-admin startproject' using Django 4.2.11.
 from pathlib import Path
 from datetime import timedelta
 from dotenv import load_dotenv
+import orjson
 import os
 
 load_dotenv()
@@ -28,6 +29,12 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "drf_orjson_renderer.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    # Match the stdlib encoder, which stringifies non-str dict keys
+    "ORJSON_RENDERER_OPTIONS": (orjson.OPT_NON_STR_KEYS,),
 }
 
 SIMPLE_JWT = {
@@ -89,6 +96,24 @@ DATABASES = {
     }
 }
 
+# Caches
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # Gemini analysis results survive restarts so unchanged videos are not re-billed
+    "gemini": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": BASE_DIR / "cache" / "gemini",
+    },
+    # Derived reports shared by every worker process, so one worker's
+    # invalidation is seen by the rest
+    "reports": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": BASE_DIR / "cache" / "reports",
+    },
+}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
@@ -130,6 +155,22 @@ AUDIO_PROCESSING = {
     "HF_TOKEN": os.getenv("HF_TOKEN"),  # Hugging Face token for model access
 }
 
+# =======================
+# Gemini API Quotas
+# =======================
+# Shared RPM/TPM budget for all Gemini calls (defaults match the free tier)
+GEMINI_REQUESTS_PER_MINUTE = int(os.getenv("GEMINI_REQUESTS_PER_MINUTE", "10"))
+GEMINI_TOKENS_PER_MINUTE = int(os.getenv("GEMINI_TOKENS_PER_MINUTE", "250000"))
+
+# Worker threads for long batch analysis jobs, kept apart from per-upload analysis
+BATCH_ANALYSIS_WORKERS = int(os.getenv("BATCH_ANALYSIS_WORKERS", "2"))
+
+# =======================
+# Comment Sentiment Cache
+# =======================
+# Max distinct comment texts whose sentiment is kept in memory (0 disables)
+COMMENT_SENTIMENT_CACHE_SIZE = int(os.getenv("COMMENT_SENTIMENT_CACHE_SIZE", "10000"))
+
 # =======================
 # Logging Config
 # =======================